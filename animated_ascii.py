@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Animated ASCII Art Converter
+Converts animated GIF/APNG frames to ASCII and stores them as a delta-encoded frame stream
+
+Frame stream format (JSON):
+    {
+        "version": 1,
+        "width": 80,                  # characters per row
+        "height": 40,                 # rows per frame
+        "durations": [100, 100, ...], # milliseconds per frame
+        "frames": [
+            "<full text of frame 0>",
+            [[offset, "run"], ...],   # every later frame: changed runs only
+            ...
+        ]
+    }
+
+Frame text is rows joined with newlines (no trailing newline). Delta offsets
+index into that text, so applying a run is a plain slice replacement.
+
+Usage:
+    python animated_ascii.py encode hero.gif hero_frames.json --width 80
+    python animated_ascii.py play hero_frames.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageSequence
+import numpy as np
+import argparse
+import json
+import os
+import sys
+import time
+
+from ascii_converter import ASCII_CHARS
+from ascii_render import charset_lut
+
+STREAM_VERSION = 1
+
+def extract_frames(image_path, background=(255, 255, 255)):
+    """
+    Decode every frame of an animated image to grayscale
+
+    Pillow composites GIF/APNG frames on seek, so each frame is a full
+    picture. Transparent areas are flattened onto the background color.
+
+    Returns:
+        (list of 2D uint8 arrays, list of durations in ms)
+    """
+    img = Image.open(image_path)
+    frames = []
+    durations = []
+    for frame in ImageSequence.Iterator(img):
+        rgba = frame.convert('RGBA')
+        flat = Image.new('RGBA', rgba.size, background + (255,))
+        flat.alpha_composite(rgba)
+        frames.append(np.asarray(flat.convert('L')))
+        durations.append(int(frame.info.get('duration', img.info.get('duration', 100)) or 100))
+    return frames, durations
+
+def render_frame(pixels, width, height, ascii_chars=ASCII_CHARS):
+    """Worker entry point: resize one grayscale frame and map it to code points"""
+    img = Image.fromarray(pixels).resize((width, height))
+    return charset_lut(ascii_chars)[np.asarray(img)]
+
+def delta_runs(previous, current, merge_gap=3):
+    """
+    Changed cells between two code point grids as [offset, text] runs
+
+    Neighbouring runs separated by no more than merge_gap unchanged cells are
+    merged, since a short stretch of repeated text is cheaper than another
+    [offset, "..."] entry.
+    """
+    rows, width = current.shape
+    changed = np.flatnonzero(previous != current)
+    if changed.size == 0:
+        return []
+
+    # Split wherever the gap to the next changed cell is too large or a row ends
+    gaps = np.diff(changed)
+    row_break = np.diff(changed // width) != 0
+    splits = np.flatnonzero((gaps > merge_gap + 1) | row_break) + 1
+    starts = np.concatenate(([0], splits))
+    ends = np.concatenate((splits, [changed.size]))
+
+    flat = current.ravel()
+    runs = []
+    for start, end in zip(starts, ends):
+        first, last = changed[start], changed[end - 1]
+        text = flat[first:last + 1].astype('<u4').tobytes().decode('utf-32-le')
+        # Offsets count the newline that ends every earlier row
+        runs.append([int(first + first // width), text])
+    return runs
+
+def grid_text(codes):
+    """Rows of a code point grid joined with newlines"""
+    return "\n".join(row.astype('<u4').tobytes().decode('utf-32-le') for row in codes)
+
+def encode_animation(image_path, width=80, height_ratio=0.5, ascii_chars=ASCII_CHARS, workers=None):
+    """
+    Convert an animated image to a delta-encoded ASCII frame stream
+
+    Args:
+        image_path: Path to an animated GIF or APNG
+        width: Target width in characters
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        ascii_chars: Characters for grayscale mapping (darkest to lightest)
+        workers: Process pool size (defaults to the CPU count)
+
+    Returns:
+        Frame stream as a dict (see module docstring)
+    """
+    frames, durations = extract_frames(image_path)
+    original_height, original_width = frames[0].shape
+    height = max(1, int(original_height / original_width * width * height_ratio))
+
+    count = len(frames)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        grids = list(pool.map(render_frame, frames, [width] * count, [height] * count,
+                              [ascii_chars] * count, chunksize=max(1, count // 32)))
+
+    encoded = [grid_text(grids[0])]
+    for previous, current in zip(grids, grids[1:]):
+        encoded.append(delta_runs(previous, current))
+
+    return {
+        "version": STREAM_VERSION,
+        "width": width,
+        "height": height,
+        "durations": durations,
+        "frames": encoded,
+    }
+
+def decode_frames(stream):
+    """Yield (text, duration_ms) for every frame of a frame stream"""
+    text = None
+    for frame, duration in zip(stream["frames"], stream["durations"]):
+        if isinstance(frame, str):
+            text = frame
+        else:
+            chars = list(text)
+            for offset, run in frame:
+                chars[offset:offset + len(run)] = run
+            text = "".join(chars)
+        yield text, duration
+
+def play(stream, loops=1):
+    """Play a frame stream in the terminal"""
+    sys.stdout.write("\x1b[2J")
+    for _ in range(loops):
+        for text, duration in decode_frames(stream):
+            sys.stdout.write("\x1b[H" + text)
+            sys.stdout.flush()
+            time.sleep(duration / 1000)
+    sys.stdout.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Animated GIF/APNG to ASCII frame streams")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    encode = commands.add_parser("encode", help="convert an animation to a frame stream")
+    encode.add_argument("image_path")
+    encode.add_argument("output")
+    encode.add_argument("--width", type=int, default=80)
+    encode.add_argument("--height-ratio", type=float, default=0.5)
+    encode.add_argument("--workers", type=int)
+
+    player = commands.add_parser("play", help="play a frame stream in the terminal")
+    player.add_argument("stream")
+    player.add_argument("--loops", type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.command == "play":
+        with open(args.stream, encoding="utf-8") as f:
+            play(json.load(f), loops=args.loops)
+        return
+
+    if not os.path.exists(args.image_path):
+        print(f"Error: Image file '{args.image_path}' not found")
+        sys.exit(1)
+
+    stream = encode_animation(args.image_path, width=args.width,
+                              height_ratio=args.height_ratio, workers=args.workers)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(stream, f, ensure_ascii=False, separators=(",", ":"))
+
+    full_size = len(stream["frames"]) * stream["height"] * (stream["width"] + 1)
+    print(f"{len(stream['frames'])} frames at {stream['width']}x{stream['height']}")
+    print(f"Saved to: {args.output} ({os.path.getsize(args.output)} bytes, "
+          f"{full_size} bytes as full frames)")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import { notFound } from 'next/navigation';
 import TerminalLayout from '../../components/TerminalLayout';
+import BookCover from '../../components/BookCover';
 import { books } from '../../data/books';
 import type { Metadata } from 'next';
 import { SITE_URL } from '../../lib/site';
@@ -125,10 +126,12 @@ export default async function BookPage({ params }: { params: Promise<{ slug: str
       <div className="grid md:grid-cols-2 gap-8">
         {/* Book Cover */}
         <div className="space-y-4">
-          <img 
-            src={book.coverUrl} 
+          <BookCover
+            coverUrl={book.coverUrl}
             alt={`${book.title} cover`}
+            sizes="(min-width: 384px) 384px, 100vw"
             className="w-full max-w-sm mx-auto rounded-lg shadow-lg border-2 border-gray-700"
+            loading="eager"
           />
         </div>
 
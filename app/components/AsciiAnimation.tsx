@@ -0,0 +1,58 @@
+'use client';
+
+import { useEffect, useMemo, useState } from 'react';
+import { cn } from '@/lib/utils';
+
+/** A changed run inside a frame: character offset and replacement text. */
+type DeltaRun = [number, string];
+
+/** Frame stream written by animated_ascii.py (see its module docstring). */
+export interface AsciiFrameStream {
+  version: number;
+  width: number;
+  height: number;
+  durations: number[];
+  frames: (string | DeltaRun[])[];
+}
+
+/** Expands a delta-encoded stream into the full text of every frame. */
+export function decodeFrames(stream: AsciiFrameStream): string[] {
+  const decoded: string[] = [];
+  let text = '';
+  for (const frame of stream.frames) {
+    if (typeof frame === 'string') {
+      text = frame;
+    } else {
+      for (const [offset, run] of frame) {
+        text = text.slice(0, offset) + run + text.slice(offset + run.length);
+      }
+    }
+    decoded.push(text);
+  }
+  return decoded;
+}
+
+interface AsciiAnimationProps {
+  stream: AsciiFrameStream;
+  className?: string;
+}
+
+export default function AsciiAnimation({ stream, className }: AsciiAnimationProps) {
+  const frames = useMemo(() => decodeFrames(stream), [stream]);
+  const [index, setIndex] = useState(0);
+
+  useEffect(() => {
+    if (frames.length < 2) return;
+    const timer = setTimeout(
+      () => setIndex((current) => (current + 1) % frames.length),
+      stream.durations[index] ?? 100,
+    );
+    return () => clearTimeout(timer);
+  }, [frames, index, stream.durations]);
+
+  return (
+    <pre className={cn('leading-none', className)} aria-hidden="true">
+      {frames[index]}
+    </pre>
+  );
+}
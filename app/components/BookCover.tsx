@@ -0,0 +1,45 @@
+import { bookCovers } from '../data/bookCovers';
+
+interface BookCoverProps {
+  coverUrl: string;
+  alt: string;
+  /** Rendered width of the cover, e.g. "64px" or "(min-width: 768px) 384px, 100vw" */
+  sizes: string;
+  className?: string;
+  loading?: 'lazy' | 'eager';
+}
+
+/**
+ * A book cover served from the responsive derivatives cover_derivatives.py
+ * writes: AVIF and WebP sources at several widths, with a single progressive
+ * JPEG for older browsers. Covers without derivatives fall back to the
+ * original file.
+ */
+export default function BookCover({
+  coverUrl,
+  alt,
+  sizes,
+  className,
+  loading = 'lazy',
+}: BookCoverProps) {
+  const cover = bookCovers[coverUrl];
+  if (!cover) {
+    return <img src={coverUrl} alt={alt} className={className} loading={loading} />;
+  }
+
+  return (
+    <picture>
+      {cover.sources.avif && <source type="image/avif" srcSet={cover.sources.avif} sizes={sizes} />}
+      <source type="image/webp" srcSet={cover.sources.webp} sizes={sizes} />
+      <img
+        src={cover.src}
+        width={cover.width}
+        height={cover.height}
+        alt={alt}
+        className={className}
+        loading={loading}
+        decoding="async"
+      />
+    </picture>
+  );
+}
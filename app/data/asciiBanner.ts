@@ -0,0 +1,65 @@
+// Generated by generate_responsive_ascii.py - do not edit by hand.
+// Every breakpoint is scaled from the same LUCAS banner master.
+
+export interface AsciiBanner {
+  lines: readonly string[];
+  text: string;
+  width: number;
+  height: number;
+}
+
+export const asciiBanner = {
+  desktop: {
+    lines: [
+      "▒▒▒       ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ ",
+      "▒▒▒       ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ ",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     ",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     ",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ ",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ ",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒",
+      "▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒",
+      "▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ ",
+      "▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ ",
+    ],
+    text: "▒▒▒       ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ \n▒▒▒       ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ \n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     \n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     \n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ \n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ \n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒\n▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒\n▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ \n▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ ",
+    width: 48,
+    height: 10,
+  },
+  tablet: {
+    lines: [
+      "▒▒     ▒▒  ▒▒  ▒▒▒▒   ▒▒▒▒   ▒▒▒▒ ",
+      "▒▒     ▒▒  ▒▒ ▒▒     ▒▒  ▒▒ ▒▒    ",
+      "▒▒     ▒▒  ▒▒ ▒▒     ▒▒▒▒▒▒  ▒▒▒▒ ",
+      "▒▒     ▒▒  ▒▒ ▒▒     ▒▒  ▒▒     ▒▒",
+      "▒▒▒▒▒▒  ▒▒▒▒   ▒▒▒▒  ▒▒  ▒▒  ▒▒▒▒ ",
+    ],
+    text: "▒▒     ▒▒  ▒▒  ▒▒▒▒   ▒▒▒▒   ▒▒▒▒ \n▒▒     ▒▒  ▒▒ ▒▒     ▒▒  ▒▒ ▒▒    \n▒▒     ▒▒  ▒▒ ▒▒     ▒▒▒▒▒▒  ▒▒▒▒ \n▒▒     ▒▒  ▒▒ ▒▒     ▒▒  ▒▒     ▒▒\n▒▒▒▒▒▒  ▒▒▒▒   ▒▒▒▒  ▒▒  ▒▒  ▒▒▒▒ ",
+    width: 34,
+    height: 5,
+  },
+  mobile: {
+    lines: [
+      "▒▒    ▒▒ ▒▒  ▒▒▒   ▒▒▒   ▒▒▒ ",
+      "▒▒    ▒▒ ▒▒ ▒▒    ▒▒ ▒▒ ▒▒   ",
+      "▒▒    ▒▒ ▒▒ ▒▒    ▒▒▒▒▒  ▒▒▒ ",
+      "▒▒    ▒▒ ▒▒ ▒▒    ▒▒ ▒▒    ▒▒",
+      "▒▒▒▒▒  ▒▒▒   ▒▒▒  ▒▒ ▒▒  ▒▒▒ ",
+    ],
+    text: "▒▒    ▒▒ ▒▒  ▒▒▒   ▒▒▒   ▒▒▒ \n▒▒    ▒▒ ▒▒ ▒▒    ▒▒ ▒▒ ▒▒   \n▒▒    ▒▒ ▒▒ ▒▒    ▒▒▒▒▒  ▒▒▒ \n▒▒    ▒▒ ▒▒ ▒▒    ▒▒ ▒▒    ▒▒\n▒▒▒▒▒  ▒▒▒   ▒▒▒  ▒▒ ▒▒  ▒▒▒ ",
+    width: 29,
+    height: 5,
+  },
+  ultra: {
+    lines: [
+      "█   █ █ ███ ███ ███",
+      "█   █ █ █   █ █ █  ",
+      "█   █ █ █   ███ ███",
+      "█   █ █ █   █ █   █",
+      "███ ███ ███ █ █ ███",
+    ],
+    text: "█   █ █ ███ ███ ███\n█   █ █ █   █ █ █  \n█   █ █ █   ███ ███\n█   █ █ █   █ █   █\n███ ███ ███ █ █ ███",
+    width: 19,
+    height: 5,
+  },
+} satisfies Record<string, AsciiBanner>;
@@ -0,0 +1,446 @@
+// Generated by cover_derivatives.py - do not edit by hand.
+
+export interface CoverDerivatives {
+  /** Intrinsic size of the source cover */
+  width: number;
+  height: number;
+  /** srcset strings by format, narrowest first */
+  sources: { avif?: string; webp: string };
+  /** Progressive JPEG for browsers without WebP */
+  src: string;
+}
+
+export const bookCovers: Record<string, CoverDerivatives> = {
+  "/images/books/a-sorceress-comes-to-call.jpg": {
+    "width": 994,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/a-sorceress-comes-to-call-96.avif 96w, /images/books/derived/a-sorceress-comes-to-call-192.avif 192w, /images/books/derived/a-sorceress-comes-to-call-384.avif 384w",
+      "webp": "/images/books/derived/a-sorceress-comes-to-call-96.webp 96w, /images/books/derived/a-sorceress-comes-to-call-192.webp 192w, /images/books/derived/a-sorceress-comes-to-call-384.webp 384w"
+    },
+    "src": "/images/books/derived/a-sorceress-comes-to-call-384.jpg"
+  },
+  "/images/books/abundance-progress.jpg": {
+    "width": 116,
+    "height": 116,
+    "sources": {
+      "avif": "/images/books/derived/abundance-progress-96.avif 96w",
+      "webp": "/images/books/derived/abundance-progress-96.webp 96w"
+    },
+    "src": "/images/books/derived/abundance-progress-96.jpg"
+  },
+  "/images/books/adapt-tim-harford.jpg": {
+    "width": 1002,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/adapt-tim-harford-96.avif 96w, /images/books/derived/adapt-tim-harford-192.avif 192w, /images/books/derived/adapt-tim-harford-384.avif 384w",
+      "webp": "/images/books/derived/adapt-tim-harford-96.webp 96w, /images/books/derived/adapt-tim-harford-192.webp 192w, /images/books/derived/adapt-tim-harford-384.webp 384w"
+    },
+    "src": "/images/books/derived/adapt-tim-harford-384.jpg"
+  },
+  "/images/books/ai-modern-approach.jpg": {
+    "width": 116,
+    "height": 116,
+    "sources": {
+      "avif": "/images/books/derived/ai-modern-approach-96.avif 96w",
+      "webp": "/images/books/derived/ai-modern-approach-96.webp 96w"
+    },
+    "src": "/images/books/derived/ai-modern-approach-96.jpg"
+  },
+  "/images/books/all-fours.jpg": {
+    "width": 335,
+    "height": 522,
+    "sources": {
+      "avif": "/images/books/derived/all-fours-96.avif 96w, /images/books/derived/all-fours-192.avif 192w",
+      "webp": "/images/books/derived/all-fours-96.webp 96w, /images/books/derived/all-fours-192.webp 192w"
+    },
+    "src": "/images/books/derived/all-fours-192.jpg"
+  },
+  "/images/books/all-that-we-see-or-seem.jpg": {
+    "width": 300,
+    "height": 450,
+    "sources": {
+      "avif": "/images/books/derived/all-that-we-see-or-seem-96.avif 96w, /images/books/derived/all-that-we-see-or-seem-192.avif 192w",
+      "webp": "/images/books/derived/all-that-we-see-or-seem-96.webp 96w, /images/books/derived/all-that-we-see-or-seem-192.webp 192w"
+    },
+    "src": "/images/books/derived/all-that-we-see-or-seem-192.jpg"
+  },
+  "/images/books/amusing-ourselves-to-death.jpg": {
+    "width": 341,
+    "height": 522,
+    "sources": {
+      "avif": "/images/books/derived/amusing-ourselves-to-death-96.avif 96w, /images/books/derived/amusing-ourselves-to-death-192.avif 192w",
+      "webp": "/images/books/derived/amusing-ourselves-to-death-96.webp 96w, /images/books/derived/amusing-ourselves-to-death-192.webp 192w"
+    },
+    "src": "/images/books/derived/amusing-ourselves-to-death-192.jpg"
+  },
+  "/images/books/angel-down.jpg": {
+    "width": 680,
+    "height": 992,
+    "sources": {
+      "avif": "/images/books/derived/angel-down-96.avif 96w, /images/books/derived/angel-down-192.avif 192w, /images/books/derived/angel-down-384.avif 384w",
+      "webp": "/images/books/derived/angel-down-96.webp 96w, /images/books/derived/angel-down-192.webp 192w, /images/books/derived/angel-down-384.webp 384w"
+    },
+    "src": "/images/books/derived/angel-down-384.jpg"
+  },
+  "/images/books/animal-farm.jpg": {
+    "width": 165,
+    "height": 165,
+    "sources": {
+      "avif": "/images/books/derived/animal-farm-96.avif 96w",
+      "webp": "/images/books/derived/animal-farm-96.webp 96w"
+    },
+    "src": "/images/books/derived/animal-farm-96.jpg"
+  },
+  "/images/books/art-of-doing-science-and-engineering.jpg": {
+    "width": 1000,
+    "height": 1480,
+    "sources": {
+      "avif": "/images/books/derived/art-of-doing-science-and-engineering-96.avif 96w, /images/books/derived/art-of-doing-science-and-engineering-192.avif 192w, /images/books/derived/art-of-doing-science-and-engineering-384.avif 384w",
+      "webp": "/images/books/derived/art-of-doing-science-and-engineering-96.webp 96w, /images/books/derived/art-of-doing-science-and-engineering-192.webp 192w, /images/books/derived/art-of-doing-science-and-engineering-384.webp 384w"
+    },
+    "src": "/images/books/derived/art-of-doing-science-and-engineering-384.jpg"
+  },
+  "/images/books/axiomatic-greg-egan.jpeg": {
+    "width": 999,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/axiomatic-greg-egan-96.avif 96w, /images/books/derived/axiomatic-greg-egan-192.avif 192w, /images/books/derived/axiomatic-greg-egan-384.avif 384w",
+      "webp": "/images/books/derived/axiomatic-greg-egan-96.webp 96w, /images/books/derived/axiomatic-greg-egan-192.webp 192w, /images/books/derived/axiomatic-greg-egan-384.webp 384w"
+    },
+    "src": "/images/books/derived/axiomatic-greg-egan-384.jpg"
+  },
+  "/images/books/behave-the-biology-of-humans-at-our-best-and-worst.jpeg": {
+    "width": 987,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-96.avif 96w, /images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-192.avif 192w, /images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-384.avif 384w",
+      "webp": "/images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-96.webp 96w, /images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-192.webp 192w, /images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-384.webp 384w"
+    },
+    "src": "/images/books/derived/behave-the-biology-of-humans-at-our-best-and-worst-384.jpg"
+  },
+  "/images/books/business-venture-capital.jpg": {
+    "width": 466,
+    "height": 466,
+    "sources": {
+      "avif": "/images/books/derived/business-venture-capital-96.avif 96w, /images/books/derived/business-venture-capital-192.avif 192w, /images/books/derived/business-venture-capital-384.avif 384w",
+      "webp": "/images/books/derived/business-venture-capital-96.webp 96w, /images/books/derived/business-venture-capital-192.webp 192w, /images/books/derived/business-venture-capital-384.webp 384w"
+    },
+    "src": "/images/books/derived/business-venture-capital-384.jpg"
+  },
+  "/images/books/culture-of-growth-joel-mokyr.jpg": {
+    "width": 300,
+    "height": 450,
+    "sources": {
+      "avif": "/images/books/derived/culture-of-growth-joel-mokyr-96.avif 96w, /images/books/derived/culture-of-growth-joel-mokyr-192.avif 192w",
+      "webp": "/images/books/derived/culture-of-growth-joel-mokyr-96.webp 96w, /images/books/derived/culture-of-growth-joel-mokyr-192.webp 192w"
+    },
+    "src": "/images/books/derived/culture-of-growth-joel-mokyr-192.jpg"
+  },
+  "/images/books/dancing-in-the-streets-a-history-of-collective-joy.jpeg": {
+    "width": 984,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-96.avif 96w, /images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-192.avif 192w, /images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-384.avif 384w",
+      "webp": "/images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-96.webp 96w, /images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-192.webp 192w, /images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-384.webp 384w"
+    },
+    "src": "/images/books/derived/dancing-in-the-streets-a-history-of-collective-joy-384.jpg"
+  },
+  "/images/books/do-androids-dream.jpg": {
+    "width": 116,
+    "height": 116,
+    "sources": {
+      "avif": "/images/books/derived/do-androids-dream-96.avif 96w",
+      "webp": "/images/books/derived/do-androids-dream-96.webp 96w"
+    },
+    "src": "/images/books/derived/do-androids-dream-96.jpg"
+  },
+  "/images/books/einstein-walter-isaacson.jpg": {
+    "width": 996,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/einstein-walter-isaacson-96.avif 96w, /images/books/derived/einstein-walter-isaacson-192.avif 192w, /images/books/derived/einstein-walter-isaacson-384.avif 384w",
+      "webp": "/images/books/derived/einstein-walter-isaacson-96.webp 96w, /images/books/derived/einstein-walter-isaacson-192.webp 192w, /images/books/derived/einstein-walter-isaacson-384.webp 384w"
+    },
+    "src": "/images/books/derived/einstein-walter-isaacson-384.jpg"
+  },
+  "/images/books/exhalation-stories.jpg": {
+    "width": 338,
+    "height": 522,
+    "sources": {
+      "avif": "/images/books/derived/exhalation-stories-96.avif 96w, /images/books/derived/exhalation-stories-192.avif 192w",
+      "webp": "/images/books/derived/exhalation-stories-96.webp 96w, /images/books/derived/exhalation-stories-192.webp 192w"
+    },
+    "src": "/images/books/derived/exhalation-stories-192.jpg"
+  },
+  "/images/books/fifty-inventions-shaped-modern-economy.jpg": {
+    "width": 298,
+    "height": 450,
+    "sources": {
+      "avif": "/images/books/derived/fifty-inventions-shaped-modern-economy-96.avif 96w, /images/books/derived/fifty-inventions-shaped-modern-economy-192.avif 192w",
+      "webp": "/images/books/derived/fifty-inventions-shaped-modern-economy-96.webp 96w, /images/books/derived/fifty-inventions-shaped-modern-economy-192.webp 192w"
+    },
+    "src": "/images/books/derived/fifty-inventions-shaped-modern-economy-192.jpg"
+  },
+  "/images/books/hbr-guide-to-finance-basic-for-managers.jpeg": {
+    "width": 833,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/hbr-guide-to-finance-basic-for-managers-96.avif 96w, /images/books/derived/hbr-guide-to-finance-basic-for-managers-192.avif 192w, /images/books/derived/hbr-guide-to-finance-basic-for-managers-384.avif 384w",
+      "webp": "/images/books/derived/hbr-guide-to-finance-basic-for-managers-96.webp 96w, /images/books/derived/hbr-guide-to-finance-basic-for-managers-192.webp 192w, /images/books/derived/hbr-guide-to-finance-basic-for-managers-384.webp 384w"
+    },
+    "src": "/images/books/derived/hbr-guide-to-finance-basic-for-managers-384.jpg"
+  },
+  "/images/books/infinity-machine.jpg": {
+    "width": 680,
+    "height": 992,
+    "sources": {
+      "avif": "/images/books/derived/infinity-machine-96.avif 96w, /images/books/derived/infinity-machine-192.avif 192w, /images/books/derived/infinity-machine-384.avif 384w",
+      "webp": "/images/books/derived/infinity-machine-96.webp 96w, /images/books/derived/infinity-machine-192.webp 192w, /images/books/derived/infinity-machine-384.webp 384w"
+    },
+    "src": "/images/books/derived/infinity-machine-384.jpg"
+  },
+  "/images/books/it-lasts-forever.jpg": {
+    "width": 288,
+    "height": 445,
+    "sources": {
+      "avif": "/images/books/derived/it-lasts-forever-96.avif 96w, /images/books/derived/it-lasts-forever-192.avif 192w",
+      "webp": "/images/books/derived/it-lasts-forever-96.webp 96w, /images/books/derived/it-lasts-forever-192.webp 192w"
+    },
+    "src": "/images/books/derived/it-lasts-forever-192.jpg"
+  },
+  "/images/books/lake-of-souls-ann-leckie.jpg": {
+    "width": 997,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/lake-of-souls-ann-leckie-96.avif 96w, /images/books/derived/lake-of-souls-ann-leckie-192.avif 192w, /images/books/derived/lake-of-souls-ann-leckie-384.avif 384w",
+      "webp": "/images/books/derived/lake-of-souls-ann-leckie-96.webp 96w, /images/books/derived/lake-of-souls-ann-leckie-192.webp 192w, /images/books/derived/lake-of-souls-ann-leckie-384.webp 384w"
+    },
+    "src": "/images/books/derived/lake-of-souls-ann-leckie-384.jpg"
+  },
+  "/images/books/making-sense-sam-harries.jpg": {
+    "width": 993,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/making-sense-sam-harries-96.avif 96w, /images/books/derived/making-sense-sam-harries-192.avif 192w, /images/books/derived/making-sense-sam-harries-384.avif 384w",
+      "webp": "/images/books/derived/making-sense-sam-harries-96.webp 96w, /images/books/derived/making-sense-sam-harries-192.webp 192w, /images/books/derived/making-sense-sam-harries-384.webp 384w"
+    },
+    "src": "/images/books/derived/making-sense-sam-harries-384.jpg"
+  },
+  "/images/books/man-who-saw-seconds.jpg": {
+    "width": 1500,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/man-who-saw-seconds-96.avif 96w, /images/books/derived/man-who-saw-seconds-192.avif 192w, /images/books/derived/man-who-saw-seconds-384.avif 384w",
+      "webp": "/images/books/derived/man-who-saw-seconds-96.webp 96w, /images/books/derived/man-who-saw-seconds-192.webp 192w, /images/books/derived/man-who-saw-seconds-384.webp 384w"
+    },
+    "src": "/images/books/derived/man-who-saw-seconds-384.jpg"
+  },
+  "/images/books/moonbound.jpg": {
+    "width": 341,
+    "height": 522,
+    "sources": {
+      "avif": "/images/books/derived/moonbound-96.avif 96w, /images/books/derived/moonbound-192.avif 192w",
+      "webp": "/images/books/derived/moonbound-96.webp 96w, /images/books/derived/moonbound-192.webp 192w"
+    },
+    "src": "/images/books/derived/moonbound-192.jpg"
+  },
+  "/images/books/neuromancer-william-gibson.jpeg": {
+    "width": 1000,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/neuromancer-william-gibson-96.avif 96w, /images/books/derived/neuromancer-william-gibson-192.avif 192w, /images/books/derived/neuromancer-william-gibson-384.avif 384w",
+      "webp": "/images/books/derived/neuromancer-william-gibson-96.webp 96w, /images/books/derived/neuromancer-william-gibson-192.webp 192w, /images/books/derived/neuromancer-william-gibson-384.webp 384w"
+    },
+    "src": "/images/books/derived/neuromancer-william-gibson-384.jpg"
+  },
+  "/images/books/scaling-era.jpg": {
+    "width": 338,
+    "height": 500,
+    "sources": {
+      "avif": "/images/books/derived/scaling-era-96.avif 96w, /images/books/derived/scaling-era-192.avif 192w",
+      "webp": "/images/books/derived/scaling-era-96.webp 96w, /images/books/derived/scaling-era-192.webp 192w"
+    },
+    "src": "/images/books/derived/scaling-era-192.jpg"
+  },
+  "/images/books/so-late-in-the-day-claire-keegan.jpg": {
+    "width": 960,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/so-late-in-the-day-claire-keegan-96.avif 96w, /images/books/derived/so-late-in-the-day-claire-keegan-192.avif 192w, /images/books/derived/so-late-in-the-day-claire-keegan-384.avif 384w",
+      "webp": "/images/books/derived/so-late-in-the-day-claire-keegan-96.webp 96w, /images/books/derived/so-late-in-the-day-claire-keegan-192.webp 192w, /images/books/derived/so-late-in-the-day-claire-keegan-384.webp 384w"
+    },
+    "src": "/images/books/derived/so-late-in-the-day-claire-keegan-384.jpg"
+  },
+  "/images/books/sourdough.jpg": {
+    "width": 326,
+    "height": 500,
+    "sources": {
+      "avif": "/images/books/derived/sourdough-96.avif 96w, /images/books/derived/sourdough-192.avif 192w",
+      "webp": "/images/books/derived/sourdough-96.webp 96w, /images/books/derived/sourdough-192.webp 192w"
+    },
+    "src": "/images/books/derived/sourdough-192.jpg"
+  },
+  "/images/books/taiwan-travelogue.jpg": {
+    "width": 680,
+    "height": 992,
+    "sources": {
+      "avif": "/images/books/derived/taiwan-travelogue-96.avif 96w, /images/books/derived/taiwan-travelogue-192.avif 192w, /images/books/derived/taiwan-travelogue-384.avif 384w",
+      "webp": "/images/books/derived/taiwan-travelogue-96.webp 96w, /images/books/derived/taiwan-travelogue-192.webp 192w, /images/books/derived/taiwan-travelogue-384.webp 384w"
+    },
+    "src": "/images/books/derived/taiwan-travelogue-384.jpg"
+  },
+  "/images/books/the-city-and-the-city-china-mieville.jpeg": {
+    "width": 1001,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-city-and-the-city-china-mieville-96.avif 96w, /images/books/derived/the-city-and-the-city-china-mieville-192.avif 192w, /images/books/derived/the-city-and-the-city-china-mieville-384.avif 384w",
+      "webp": "/images/books/derived/the-city-and-the-city-china-mieville-96.webp 96w, /images/books/derived/the-city-and-the-city-china-mieville-192.webp 192w, /images/books/derived/the-city-and-the-city-china-mieville-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-city-and-the-city-china-mieville-384.jpg"
+  },
+  "/images/books/the-conquest-of-happiness.jpg": {
+    "width": 334,
+    "height": 454,
+    "sources": {
+      "avif": "/images/books/derived/the-conquest-of-happiness-96.avif 96w, /images/books/derived/the-conquest-of-happiness-192.avif 192w",
+      "webp": "/images/books/derived/the-conquest-of-happiness-96.webp 96w, /images/books/derived/the-conquest-of-happiness-192.webp 192w"
+    },
+    "src": "/images/books/derived/the-conquest-of-happiness-192.jpg"
+  },
+  "/images/books/the-economic-structure-of-corporate-law.jpeg": {
+    "width": 996,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-economic-structure-of-corporate-law-96.avif 96w, /images/books/derived/the-economic-structure-of-corporate-law-192.avif 192w, /images/books/derived/the-economic-structure-of-corporate-law-384.avif 384w",
+      "webp": "/images/books/derived/the-economic-structure-of-corporate-law-96.webp 96w, /images/books/derived/the-economic-structure-of-corporate-law-192.webp 192w, /images/books/derived/the-economic-structure-of-corporate-law-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-economic-structure-of-corporate-law-384.jpg"
+  },
+  "/images/books/the-end-of-history-and-the-last-man.jpg": {
+    "width": 887,
+    "height": 1360,
+    "sources": {
+      "avif": "/images/books/derived/the-end-of-history-and-the-last-man-96.avif 96w, /images/books/derived/the-end-of-history-and-the-last-man-192.avif 192w, /images/books/derived/the-end-of-history-and-the-last-man-384.avif 384w",
+      "webp": "/images/books/derived/the-end-of-history-and-the-last-man-96.webp 96w, /images/books/derived/the-end-of-history-and-the-last-man-192.webp 192w, /images/books/derived/the-end-of-history-and-the-last-man-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-end-of-history-and-the-last-man-384.jpg"
+  },
+  "/images/books/the-federalist-papers.jpeg": {
+    "width": 625,
+    "height": 1029,
+    "sources": {
+      "avif": "/images/books/derived/the-federalist-papers-96.avif 96w, /images/books/derived/the-federalist-papers-192.avif 192w, /images/books/derived/the-federalist-papers-384.avif 384w",
+      "webp": "/images/books/derived/the-federalist-papers-96.webp 96w, /images/books/derived/the-federalist-papers-192.webp 192w, /images/books/derived/the-federalist-papers-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-federalist-papers-384.jpg"
+  },
+  "/images/books/the-hidden-girl-ken-liu.jpg": {
+    "width": 1500,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-hidden-girl-ken-liu-96.avif 96w, /images/books/derived/the-hidden-girl-ken-liu-192.avif 192w, /images/books/derived/the-hidden-girl-ken-liu-384.avif 384w",
+      "webp": "/images/books/derived/the-hidden-girl-ken-liu-96.webp 96w, /images/books/derived/the-hidden-girl-ken-liu-192.webp 192w, /images/books/derived/the-hidden-girl-ken-liu-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-hidden-girl-ken-liu-384.jpg"
+  },
+  "/images/books/the-left-hand-of-darkness-ursula-k-le-guin.jpeg": {
+    "width": 838,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-96.avif 96w, /images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-192.avif 192w, /images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-384.avif 384w",
+      "webp": "/images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-96.webp 96w, /images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-192.webp 192w, /images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-left-hand-of-darkness-ursula-k-le-guin-384.jpg"
+  },
+  "/images/books/the-man-who-sees-in-seconds.jpg": {
+    "width": 300,
+    "height": 450,
+    "sources": {
+      "avif": "/images/books/derived/the-man-who-sees-in-seconds-96.avif 96w, /images/books/derived/the-man-who-sees-in-seconds-192.avif 192w",
+      "webp": "/images/books/derived/the-man-who-sees-in-seconds-96.webp 96w, /images/books/derived/the-man-who-sees-in-seconds-192.webp 192w"
+    },
+    "src": "/images/books/derived/the-man-who-sees-in-seconds-192.jpg"
+  },
+  "/images/books/the-mountain-in-the-sea.jpg": {
+    "width": 326,
+    "height": 500,
+    "sources": {
+      "avif": "/images/books/derived/the-mountain-in-the-sea-96.avif 96w, /images/books/derived/the-mountain-in-the-sea-192.avif 192w",
+      "webp": "/images/books/derived/the-mountain-in-the-sea-96.webp 96w, /images/books/derived/the-mountain-in-the-sea-192.webp 192w"
+    },
+    "src": "/images/books/derived/the-mountain-in-the-sea-192.jpg"
+  },
+  "/images/books/the-tainted-cup.jpg": {
+    "width": 987,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-tainted-cup-96.avif 96w, /images/books/derived/the-tainted-cup-192.avif 192w, /images/books/derived/the-tainted-cup-384.avif 384w",
+      "webp": "/images/books/derived/the-tainted-cup-96.webp 96w, /images/books/derived/the-tainted-cup-192.webp 192w, /images/books/derived/the-tainted-cup-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-tainted-cup-384.jpg"
+  },
+  "/images/books/the-tangled-tree-a-radical-new-history-of-life.jpg": {
+    "width": 993,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-tangled-tree-a-radical-new-history-of-life-96.avif 96w, /images/books/derived/the-tangled-tree-a-radical-new-history-of-life-192.avif 192w, /images/books/derived/the-tangled-tree-a-radical-new-history-of-life-384.avif 384w",
+      "webp": "/images/books/derived/the-tangled-tree-a-radical-new-history-of-life-96.webp 96w, /images/books/derived/the-tangled-tree-a-radical-new-history-of-life-192.webp 192w, /images/books/derived/the-tangled-tree-a-radical-new-history-of-life-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-tangled-tree-a-radical-new-history-of-life-384.jpg"
+  },
+  "/images/books/the-tusks-of-extinction-ray-nayler.jpg": {
+    "width": 978,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/the-tusks-of-extinction-ray-nayler-96.avif 96w, /images/books/derived/the-tusks-of-extinction-ray-nayler-192.avif 192w, /images/books/derived/the-tusks-of-extinction-ray-nayler-384.avif 384w",
+      "webp": "/images/books/derived/the-tusks-of-extinction-ray-nayler-96.webp 96w, /images/books/derived/the-tusks-of-extinction-ray-nayler-192.webp 192w, /images/books/derived/the-tusks-of-extinction-ray-nayler-384.webp 384w"
+    },
+    "src": "/images/books/derived/the-tusks-of-extinction-ray-nayler-384.jpg"
+  },
+  "/images/books/thinking-in-systems.jpg": {
+    "width": 265,
+    "height": 400,
+    "sources": {
+      "avif": "/images/books/derived/thinking-in-systems-96.avif 96w, /images/books/derived/thinking-in-systems-192.avif 192w",
+      "webp": "/images/books/derived/thinking-in-systems-96.webp 96w, /images/books/derived/thinking-in-systems-192.webp 192w"
+    },
+    "src": "/images/books/derived/thinking-in-systems-192.jpg"
+  },
+  "/images/books/tomorrow-and-tomorrow.jpg": {
+    "width": 116,
+    "height": 116,
+    "sources": {
+      "avif": "/images/books/derived/tomorrow-and-tomorrow-96.avif 96w",
+      "webp": "/images/books/derived/tomorrow-and-tomorrow-96.webp 96w"
+    },
+    "src": "/images/books/derived/tomorrow-and-tomorrow-96.jpg"
+  },
+  "/images/books/unworld-jayson-greene.jpg": {
+    "width": 1000,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/unworld-jayson-greene-96.avif 96w, /images/books/derived/unworld-jayson-greene-192.avif 192w, /images/books/derived/unworld-jayson-greene-384.avif 384w",
+      "webp": "/images/books/derived/unworld-jayson-greene-96.webp 96w, /images/books/derived/unworld-jayson-greene-192.webp 192w, /images/books/derived/unworld-jayson-greene-384.webp 384w"
+    },
+    "src": "/images/books/derived/unworld-jayson-greene-384.jpg"
+  },
+  "/images/books/we-the-corporations-how-american-businesses-won-their-civil-rights.jpeg": {
+    "width": 1000,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-96.avif 96w, /images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-192.avif 192w, /images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-384.avif 384w",
+      "webp": "/images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-96.webp 96w, /images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-192.webp 192w, /images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-384.webp 384w"
+    },
+    "src": "/images/books/derived/we-the-corporations-how-american-businesses-won-their-civil-rights-384.jpg"
+  },
+  "/images/books/where-is-my-flying-car.jpeg": {
+    "width": 1027,
+    "height": 1500,
+    "sources": {
+      "avif": "/images/books/derived/where-is-my-flying-car-96.avif 96w, /images/books/derived/where-is-my-flying-car-192.avif 192w, /images/books/derived/where-is-my-flying-car-384.avif 384w",
+      "webp": "/images/books/derived/where-is-my-flying-car-96.webp 96w, /images/books/derived/where-is-my-flying-car-192.webp 192w, /images/books/derived/where-is-my-flying-car-384.webp 384w"
+    },
+    "src": "/images/books/derived/where-is-my-flying-car-384.jpg"
+  }
+};
@@ -0,0 +1,48 @@
+/**
+ * Decoder for packed ASCII art assets.
+ *
+ * ascii_pack.py stores art as 4-bit palette indices with run-length encoding,
+ * roughly an order of magnitude smaller than the text for the block-heavy
+ * portraits. This turns those bytes back into the exact original string; see
+ * the module docstring in ascii_pack.py for the layout.
+ */
+
+const MAGIC = "ASCP";
+const VERSION = 1;
+
+export function unpackAscii(packed: Uint8Array): string {
+  const view = new DataView(packed.buffer, packed.byteOffset, packed.byteLength);
+  if (String.fromCharCode(...packed.subarray(0, 4)) !== MAGIC) {
+    throw new Error("Not a packed ASCII art file");
+  }
+  const version = view.getUint8(4);
+  if (version !== VERSION) {
+    throw new Error(`Unsupported packed format version ${version}`);
+  }
+
+  const paletteLength = view.getUint16(6, true);
+  let offset = 8;
+  const palette = Array.from(
+    new TextDecoder().decode(packed.subarray(offset, offset + paletteLength)),
+  );
+  offset += paletteLength;
+
+  const runCount = view.getUint32(offset, true);
+  const extendedCount = view.getUint32(offset + 4, true);
+  offset += 8;
+  const headers = packed.subarray(offset, offset + runCount);
+  let extendedOffset = offset + runCount;
+  const extendedEnd = extendedOffset + extendedCount * 2;
+
+  const parts: string[] = [];
+  for (const header of headers) {
+    let length = (header & 15) + 1;
+    if (length === 16) {
+      if (extendedOffset >= extendedEnd) throw new Error("Truncated packed ASCII art");
+      length += view.getUint16(extendedOffset, true);
+      extendedOffset += 2;
+    }
+    parts.push(palette[header >> 4].repeat(length));
+  }
+  return parts.join("");
+}
@@ -12,6 +12,7 @@ import { ListeningSection } from "./components/ListeningSection";
 import { ExpandableSection } from "./components/ExpandableSection";
 import ApebotChat from "./components/ApebotChat";
 import SyllabusPartIcon from "./components/SyllabusPartIcon";
+import BookCover from "./components/BookCover";
 import FeaturedTweets from "./components/FeaturedTweets";
 import ShipLog from "./components/ShipLog";
 import { featuredTweets } from "./data/tweets";
@@ -45,6 +46,7 @@ interface GitHubContributionData {
 import { type Book, books as recentBooks } from "./data/books";
 import { syllabus, getSyllabusStats } from "./data/syllabus";
 import { toys } from "./data/toys";
+import { asciiBanner } from "./data/asciiBanner";
 import { lennyRecommendations } from "./data/lenny";
 import { getPublishedPosts } from "./data/blog";
 
@@ -284,35 +286,18 @@ export default function TerminalRepoList() {
         </div>
         {/* Desktop ASCII Art */}
         <pre className="text-[#8b0000] mb-2 text-xs leading-none hidden lg:block">
-          {`
-▒▒▒        ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ 
-▒▒▒        ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ 
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ 
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ 
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒
-▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒
-▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ 
-▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒`}
+          {"\n"}
+          {asciiBanner.desktop.text}
         </pre>
         {/* Tablet ASCII Art */}
         <pre className="text-[#8b0000] mb-2 text-xs leading-none hidden md:block lg:hidden">
-          {`
-▒▒▒     ▒▒  ▒▒  ▒▒▒▒   ▒▒▒▒   ▒▒▒▒ 
-▒▒▒     ▒▒  ▒▒  ▒▒     ▒▒▒▒   ▒▒   
-▒▒▒     ▒▒  ▒▒  ▒▒     ▒▒▒▒   ▒▒▒▒ 
-▒▒▒     ▒▒  ▒▒  ▒▒     ▒  ▒      ▒▒
-▒▒▒▒▒▒  ▒▒▒▒▒   ▒▒▒▒   ▒  ▒   ▒▒▒▒`}
+          {"\n"}
+          {asciiBanner.tablet.text}
         </pre>
         {/* Mobile ASCII Art */}
         <pre className="text-[#8b0000] mb-2 text-xs leading-none block md:hidden">
-          {`
-▒▒    ▒▒  ▒▒  ▒▒▒  ▒▒▒  ▒▒▒
-▒▒    ▒▒  ▒▒  ▒    ▒▒▒  ▒  
-▒▒    ▒▒  ▒▒  ▒    ▒▒▒  ▒▒▒
-▒▒    ▒▒  ▒▒  ▒    ▒ ▒    ▒
-▒▒▒▒  ▒▒▒▒   ▒▒▒  ▒  ▒  ▒▒▒`}
+          {"\n"}
+          {asciiBanner.mobile.text}
         </pre>
         <div className="text-[#333333] mb-1 text-xs md:text-sm">
           <span className="hidden sm:inline">
@@ -762,9 +747,10 @@ export default function TerminalRepoList() {
                                       )}
                                       <div className="flex gap-4">
                                         <div className="flex-shrink-0">
-                                          <img
-                                            src={book.coverUrl}
+                                          <BookCover
+                                            coverUrl={book.coverUrl}
                                             alt={`${book.title} cover`}
+                                            sizes="64px"
                                             className="w-16 h-24 object-cover rounded shadow-sm"
                                           />
                                         </div>
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Two-tier render cache for the ASCII art converters
+In-process LRU in front of an on-disk store, keyed by source content hash and render parameters
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import time
+
+ERROR_PREFIX = "Error processing image"
+
+# Part of every cache key; bump whenever the converters' output changes for
+# the same parameters so stale renders are never served
+RENDER_VERSION = 2
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_key(content_hash, params):
+    """Cache key from the source bytes' hash, the render parameters and RENDER_VERSION"""
+    payload = json.dumps({"render_version": RENDER_VERSION, **params}, sort_keys=True,
+                         ensure_ascii=False)
+    return hashlib.sha256(f"{content_hash}\n{payload}".encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """
+    LRU of rendered ASCII strings backed by a directory of <key>.txt files
+
+    The memory tier evicts least recently used entries past max_entries or
+    max_memory_bytes. The disk tier evicts entries older than max_age seconds
+    (since last use) and then the oldest entries until it fits in
+    max_disk_bytes; pass cache_dir=None for a memory-only cache. Hits and
+    misses are counted per tier in `stats`.
+    """
+
+    def __init__(self, cache_dir=".ascii_cache", max_entries=256, max_memory_bytes=32 << 20,
+                 max_disk_bytes=256 << 20, max_age=30 * 24 * 3600, prune_every=32):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.prune_every = prune_every
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._hashes = {}
+        self._puts = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.prune()
+
+    def key(self, image_path, params):
+        """
+        Cache key for rendering image_path with params
+
+        The content hash is remembered per (path, size, mtime) so repeated
+        lookups in one process do not re-read the file.
+        """
+        stat = os.stat(image_path)
+        identity = (os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns)
+        content_hash = self._hashes.get(identity)
+        if content_hash is None:
+            content_hash = self._hashes[identity] = file_hash(image_path)
+        return cache_key(content_hash, params)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def _remember(self, key, text):
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = text
+        self._memory_bytes += len(text)
+        while self._memory and (len(self._memory) > self.max_entries
+                                or self._memory_bytes > self.max_memory_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key):
+        """Cached text for key, or None on a miss"""
+        text = self._memory.get(key)
+        if text is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return text
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                if time.time() - os.path.getmtime(path) <= self.max_age:
+                    with open(path, encoding="utf-8") as f:
+                        text = f.read()
+                    # Refresh the mtime so age counts from last use
+                    os.utime(path)
+            except FileNotFoundError:
+                text = None
+            if text is not None:
+                self.stats["disk_hits"] += 1
+                self._remember(key, text)
+                return text
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key, text):
+        """Store text under key in both tiers"""
+        self._remember(key, text)
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        self._puts += 1
+        if self._puts % self.prune_every == 0:
+            self.prune()
+
+    def prune(self):
+        """Drop expired disk entries, then the least recently used until under max_disk_bytes"""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".txt"):
+                continue
+            stat = entry.stat()
+            if now - stat.st_mtime > self.max_age:
+                os.remove(entry.path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def summary(self):
+        """One-line hit/miss report"""
+        stats = self.stats
+        return (f"cache: {stats['memory_hits']} memory hits, {stats['disk_hits']} disk hits, "
+                f"{stats['misses']} misses")
@@ -5,10 +5,29 @@ Converts images to ASCII art with character-based grayscale mapping
 """
 
 from PIL import Image
+import numpy as np
+import argparse
+import resource
 import sys
 import os
 
-def image_to_ascii(image_path, width=80, height_ratio=0.5):
+from ascii_cache import RenderCache
+from ascii_render import (braille_codes, charset_lut, dither_indices, half_block_codes,
+                          histogram_curve, pixels_to_ascii, render_codepoints)
+
+# ASCII characters for grayscale mapping (darkest to lightest)
+# Using a comprehensive set for better depth representation
+ASCII_CHARS = "@%#*+=-:. "
+
+# Source pixels per character cell (columns, rows) for each output mode
+MODES = {
+    "ascii": (1, 1),
+    "half-block": (1, 2),
+    "braille": (2, 4),
+}
+
+def image_to_ascii(image_path, width=80, height_ratio=0.5, ascii_chars=ASCII_CHARS,
+                   auto_levels=None, mode="ascii", threshold=128, dither=None, color=False):
     """
     Convert an image to ASCII art with grayscale mapping
     
@@ -16,54 +35,207 @@ def image_to_ascii(image_path, width=80, height_ratio=0.5):
         image_path: Path to the input image
         width: Target width in characters
         height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        ascii_chars: Characters for grayscale mapping (darkest to lightest)
+        auto_levels: None, "levels" or "equalize" to remap the ramp from the
+            resized image's histogram (see ascii_render.histogram_curve)
+        mode: "ascii", or "half-block" (▀▄█, 1x2 pixels per cell) or
+            "braille" (2x4 dots per cell) for more detail in the same columns
+        threshold: Sub-character modes draw pixels darker than this
+        dither: None, "bayer", "floyd-steinberg" or "atkinson" to dither the
+            sub-character pixels instead of thresholding them
+        color: Half-block mode only - ANSI truecolor with the top pixel as
+            foreground and the bottom pixel as background
     
     Returns:
         ASCII art as string
     """
     
-    # ASCII characters for grayscale mapping (darkest to lightest)
-    # Using a comprehensive set for better depth representation
-    ascii_chars = "@%#*+=-:. "
-    
     try:
         # Open and process the image
         img = Image.open(image_path)
         
-        # Convert to grayscale
-        img = img.convert('L')
-        
         # Calculate new dimensions maintaining aspect ratio
         original_width, original_height = img.size
         aspect_ratio = original_height / original_width
         new_height = int(aspect_ratio * width * height_ratio)
         
+        if mode != "ascii":
+            return subcell_ascii(img, width, new_height, mode, threshold, dither, color, auto_levels)
+        
+        # Convert to grayscale
+        img = img.convert('L')
+        
         # Resize image
         img = img.resize((width, new_height))
         
-        # Convert pixels to ASCII
-        pixels = img.getdata()
-        ascii_str = ""
-        
-        for i, pixel in enumerate(pixels):
-            # Map pixel value (0-255) to ascii character index
-            ascii_index = min(len(ascii_chars) - 1, pixel // (256 // len(ascii_chars)))
-            ascii_str += ascii_chars[ascii_index]
-            
-            # Add newline at end of each row
-            if (i + 1) % width == 0:
-                ascii_str += "\n"
+        # Histogram-driven remap folds into the same lookup table
+        curve = histogram_curve(img.histogram(), auto_levels) if auto_levels else None
         
-        return ascii_str
+        # Map every pixel through the charset lookup table at once
+        lut = charset_lut(ascii_chars, curve=curve)
+        return pixels_to_ascii(np.asarray(img), lut)
         
     except Exception as e:
         return f"Error processing image: {str(e)}"
 
+def subcell_ascii(img, width, height, mode, threshold=128, dither=None, color=False,
+                  auto_levels=None):
+    """
+    Render an opened image with several pixels packed into every character
+    
+    Args:
+        img: PIL image
+        width: Output width in characters
+        height: Output height in characters
+        mode: "half-block" or "braille"
+        (other arguments as for image_to_ascii)
+    
+    Returns:
+        Character art as string
+    """
+    cell_width, cell_height = MODES[mode]
+    size = (width * cell_width, height * cell_height)
+    
+    if color and mode == "half-block":
+        from color_ascii import format_ansi_half_blocks
+        return format_ansi_half_blocks(np.asarray(img.convert('RGB').resize(size)))
+    
+    gray = img.convert('L').resize(size)
+    pixels = np.asarray(gray)
+    if auto_levels:
+        pixels = histogram_curve(gray.histogram(), auto_levels)[pixels]
+    
+    # Dark pixels are drawn, matching the dense end of the character ramps
+    if dither:
+        ink = dither_indices((255 - pixels.astype(np.float64)) / 255, 2, dither) == 1
+    else:
+        ink = pixels < threshold
+    
+    codes = braille_codes(ink) if mode == "braille" else half_block_codes(ink)
+    return render_codepoints(codes)
+
+def load_grayscale_bounded(image_path, width, height_ratio=0.5, oversample=2):
+    """
+    Decode an image to a small grayscale buffer without a full-resolution copy
+
+    JPEGs are decoded straight to grayscale at 1/2, 1/4 or 1/8 scale in the
+    DCT domain (Image.draft), so the decoder never allocates the full-size
+    raster. Whatever is left is box-reduced in horizontal bands, converting
+    one band to grayscale at a time. Other formats still decode at full size,
+    but skip the extra full-resolution grayscale copy.
+
+    Args:
+        image_path: Path to the input image
+        width: Widest output width in characters that will be rendered
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        oversample: Keep at least this many source pixels per output cell
+
+    Returns:
+        (grayscale image, original height / width aspect ratio)
+    """
+
+    img = Image.open(image_path)
+
+    # Header only - nothing has been decoded yet
+    original_width, original_height = img.size
+    aspect_ratio = original_height / original_width
+    new_height = max(1, int(aspect_ratio * width * height_ratio))
+    target = (width * oversample, new_height * oversample)
+
+    # Let the JPEG decoder do the first reduction (no-op for other formats)
+    img.draft('L', target)
+
+    factor = max(1, min(img.width // target[0], img.height // target[1]))
+    if factor == 1:
+        return img.convert('L'), aspect_ratio
+
+    # Tiled box reduction, one band of source rows at a time
+    reduced = Image.new('L', (img.width // factor, img.height // factor))
+    band = factor * max(1, 256 // factor)
+    for top in range(0, reduced.height * factor, band):
+        bottom = min(top + band, reduced.height * factor)
+        strip = img.crop((0, top, reduced.width * factor, bottom))
+        reduced.paste(strip.convert('L').reduce(factor), (0, top // factor))
+
+    return reduced, aspect_ratio
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in megabytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def stream_image_to_ascii(image_path, width=80, height_ratio=0.5):
+    """
+    Bounded-memory variant of image_to_ascii for very large source images
+
+    Peak memory follows the output size rather than the input size for
+    JPEG sources. See load_grayscale_bounded() for the details.
+
+    Args:
+        image_path: Path to the input image
+        width: Target width in characters
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+
+    Returns:
+        ASCII art as string
+    """
+
+    try:
+        return ascii_pyramid(image_path, [width], height_ratio, stream=True)[width]
+    except Exception as e:
+        return f"Error processing image: {str(e)}"
+
+def ascii_pyramid(image_path, widths=(60, 80, 100), height_ratio=0.5, stream=False):
+    """
+    Convert one image to ASCII art at several widths, decoding it only once
+
+    The grayscale source is resized to the widest level first and every
+    narrower level is derived from the level above it, so the full-size
+    buffer is touched once no matter how many widths are requested.
+    Narrower levels can differ from a standalone image_to_ascii() call by a
+    character here and there because they are resampled from a smaller image.
+
+    Args:
+        image_path: Path to the input image
+        widths: Target widths in characters
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        stream: Decode through load_grayscale_bounded() to cap peak memory
+
+    Returns:
+        Dict mapping each width to its ASCII art string
+    """
+
+    lut = charset_lut(ASCII_CHARS)
+
+    # Decode and convert to grayscale once
+    if stream:
+        img, aspect_ratio = load_grayscale_bounded(image_path, max(widths), height_ratio)
+    else:
+        img = Image.open(image_path).convert('L')
+        original_width, original_height = img.size
+        aspect_ratio = original_height / original_width
+
+    levels = {}
+    level = img
+    for width in sorted(set(widths), reverse=True):
+        new_height = int(aspect_ratio * width * height_ratio)
+        level = level.resize((width, new_height))
+        levels[width] = pixels_to_ascii(np.asarray(level), lut)
+
+    return {width: levels[width] for width in widths}
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python ascii_converter.py <image_path>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Convert an image to ASCII art")
+    parser.add_argument("image_path")
+    parser.add_argument("--stream", action="store_true",
+                        help="bounded-memory decode for very large images; reports peak RSS")
+    parser.add_argument("--no-cache", action="store_true", help="always re-render")
+    args = parser.parse_args()
     
-    image_path = sys.argv[1]
+    image_path = args.image_path
     
     if not os.path.exists(image_path):
         print(f"Error: Image file '{image_path}' not found")
@@ -72,12 +244,33 @@ def main():
     # Generate ASCII art with different sizes for testing
     widths = [60, 80, 100]
     
+    # Only decode the image when the render cache is missing a width. Each
+    # level is resampled from the one above it, so the key names the whole
+    # chain and a miss re-renders every level rather than a shorter chain
+    cache = RenderCache(None if args.no_cache else ".ascii_cache")
+    keys = {
+        width: cache.key(image_path, {"func": "ascii_converter.ascii_pyramid", "width": width,
+                                      "levels": sorted(widths), "height_ratio": 0.5,
+                                      "stream": args.stream})
+        for width in widths
+    }
+    pyramid = {width: cache.get(key) for width, key in keys.items()}
+    
+    if None in pyramid.values():
+        try:
+            pyramid = ascii_pyramid(image_path, widths, stream=args.stream)
+        except Exception as e:
+            print(f"Error processing image: {str(e)}")
+            sys.exit(1)
+        for width, ascii_art in pyramid.items():
+            cache.put(keys[width], ascii_art)
+    
     for width in widths:
         print(f"\n{'='*50}")
         print(f"ASCII ART - Width: {width} characters")
         print(f"{'='*50}")
         
-        ascii_art = image_to_ascii(image_path, width=width)
+        ascii_art = pyramid[width]
         print(ascii_art)
         
         # Save to file as well
@@ -85,6 +278,10 @@ def main():
         with open(output_file, 'w') as f:
             f.write(ascii_art)
         print(f"Saved to: {output_file}")
+    
+    print(f"\n{cache.summary()}")
+    if args.stream:
+        print(f"Peak RSS: {peak_rss_mb():.1f} MB")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+ASCII Art Image Exporter
+Renders ASCII art to PNG through a glyph tile atlas, or to compact SVG
+
+PNG: every distinct character is rasterized once per (font, size) into a
+uint8 coverage tile. The whole grid is then one fancy-indexing gather of
+tiles, colored through a 256-entry palette, with no per-character drawing
+calls. SVG: each run of non-space characters in a row becomes one
+<text> element.
+
+Usage:
+    python ascii_export.py enhanced_ascii_converter --png portrait.png --svg portrait.svg
+    python ascii_export.py lucas_ascii_desktop.txt --png banner.png --size 24
+"""
+
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from xml.sax.saxutils import escape
+import numpy as np
+import argparse
+import re
+import sys
+import os
+
+from glyph_ascii import BLOCK_GLYPHS, FONT_PATH
+
+# Site palette: dark red ink on the terminal window's beige
+FOREGROUND = "#8b0000"
+BACKGROUND = "#e8e8d8"
+
+def hex_color(color):
+    """'#rrggbb' -> (r, g, b)"""
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+@lru_cache(maxsize=8)
+def _font(font_path, size):
+    return ImageFont.truetype(font_path, size)
+
+def cell_size(font_path=FONT_PATH, size=16):
+    """(width, height) of one character cell: monospace advance x line height"""
+    font = _font(font_path, size)
+    ascent, descent = font.getmetrics()
+    return max(1, round(font.getlength("M"))), ascent + descent
+
+@lru_cache(maxsize=1024)
+def glyph_tile(char, font_path=FONT_PATH, size=16):
+    """
+    Ink coverage of one character cell, rasterized once per (char, font, size)
+
+    Block elements are filled geometrically (see glyph_ascii.BLOCK_GLYPHS),
+    since the vendored Latin-subset font has no outlines for them.
+
+    Returns:
+        Read-only uint8 array (cell height, cell width), 255 = full ink
+    """
+    width, height = cell_size(font_path, size)
+    if char in BLOCK_GLYPHS:
+        coverage, (left, top, right, bottom) = BLOCK_GLYPHS[char]
+        tile = np.zeros((height, width), dtype=np.uint8)
+        tile[round(top * height):round(bottom * height),
+             round(left * width):round(right * width)] = round(coverage * 255)
+    else:
+        img = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(img).text((0, 0), char, font=_font(font_path, size), fill=255)
+        tile = np.array(img)
+    tile.flags.writeable = False
+    return tile
+
+def text_grid(text):
+    """Code point grid of ASCII art, ragged rows padded with spaces"""
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    width = max((len(line) for line in lines), default=0)
+    padded = "".join(line.ljust(width) for line in lines)
+    return np.frombuffer(padded.encode('utf-32-le'), dtype='<u4').reshape(len(lines), width)
+
+def ascii_to_png(text, output_path=None, font_path=FONT_PATH, size=16, foreground=FOREGROUND,
+                 background=BACKGROUND, padding=16):
+    """
+    Render ASCII art as an image
+
+    Args:
+        text: ASCII art
+        output_path: Save here as well if given
+        font_path: Monospace TTF/OTF/WOFF2 font
+        size: Font size in pixels
+        foreground: Ink color, '#rrggbb'
+        background: Background color, '#rrggbb'
+        padding: Margin around the grid in pixels
+
+    Returns:
+        PIL RGB image
+    """
+    grid = text_grid(text)
+    rows, cols = grid.shape
+    cell_width, cell_height = cell_size(font_path, size)
+
+    canvas = np.zeros((rows * cell_height + 2 * padding, cols * cell_width + 2 * padding),
+                      dtype=np.uint8)
+
+    # One tile per distinct character, then gather them for the whole grid;
+    # empty art leaves just the padded background, like ascii_to_svg
+    if rows and cols:
+        codes, indices = np.unique(grid, return_inverse=True)
+        atlas = np.stack([glyph_tile(chr(code), font_path, size) for code in codes])
+        coverage = (atlas[indices.reshape(rows, cols)]
+                    .transpose(0, 2, 1, 3)
+                    .reshape(rows * cell_height, cols * cell_width))
+        canvas[padding:padding + rows * cell_height, padding:padding + cols * cell_width] = coverage
+
+    # Coverage level -> color as a 256-entry palette; PIL applies it per pixel
+    fg = np.array(hex_color(foreground), dtype=np.float64)
+    bg = np.array(hex_color(background), dtype=np.float64)
+    colors = (bg + np.arange(256)[:, None] / 255 * (fg - bg) + 0.5).astype(np.uint8)
+    img = Image.fromarray(canvas, 'L')
+    img.putpalette(colors.tobytes())
+
+    if output_path:
+        img.save(output_path, optimize=True)
+    return img.convert('RGB')
+
+def ascii_to_svg(text, output_path=None, size=16, foreground=FOREGROUND, background=BACKGROUND,
+                 padding=16, font_family="'JetBrains Mono', ui-monospace, monospace"):
+    """
+    Render ASCII art as SVG, one <text> element per run of non-space characters
+
+    Runs are pinned to their grid columns with textLength, so alignment holds
+    even when the viewer substitutes a font with a different advance.
+
+    Args:
+        text: ASCII art
+        output_path: Save here as well if given
+        size: Font size in SVG units
+        foreground: Ink color, '#rrggbb'
+        background: Background color, '#rrggbb'
+        padding: Margin around the grid
+        font_family: CSS font-family list
+
+    Returns:
+        SVG document as string
+    """
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    advance = 0.6 * size  # monospace advance of JetBrains Mono, in em
+    line_height = 1.2 * size
+    width = max((len(line) for line in lines), default=0) * advance + 2 * padding
+    height = len(lines) * line_height + 2 * padding
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+        f'viewBox="0 0 {width:g} {height:g}">',
+        f'<rect width="100%" height="100%" fill="{background}"/>',
+        f'<g fill="{foreground}" font-family="{escape(font_family)}" font-size="{size:g}" '
+        f'xml:space="preserve">',
+    ]
+    for row, line in enumerate(lines):
+        y = padding + row * line_height + 0.8 * size
+        for match in re.finditer(r"\S+(?: +\S+)*", line):
+            run = match.group()
+            x = padding + match.start() * advance
+            parts.append(f'<text x="{x:g}" y="{y:g}" textLength="{len(run) * advance:g}" '
+                         f'lengthAdjust="spacingAndGlyphs">{escape(run)}</text>')
+    parts.append("</g></svg>")
+
+    svg = "\n".join(parts) + "\n"
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(svg)
+    return svg
+
+def main():
+    parser = argparse.ArgumentParser(description="Export ASCII art as PNG or SVG")
+    parser.add_argument("source", help="text file, or a portrait name from ascii_pack.portrait_sources()")
+    parser.add_argument("--png", help="PNG output path")
+    parser.add_argument("--svg", help="SVG output path")
+    parser.add_argument("--size", type=int, default=16, help="font size in pixels")
+    parser.add_argument("--font", default=FONT_PATH, help="monospace font for PNG output")
+    parser.add_argument("--foreground", default=FOREGROUND)
+    parser.add_argument("--background", default=BACKGROUND)
+    args = parser.parse_args()
+
+    if not args.png and not args.svg:
+        parser.error("pass --png and/or --svg")
+
+    if os.path.exists(args.source):
+        with open(args.source, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        from ascii_pack import portrait_sources
+        portraits = portrait_sources()
+        if args.source not in portraits:
+            print(f"Error: '{args.source}' is neither a file nor one of: {', '.join(portraits)}")
+            sys.exit(1)
+        text = portraits[args.source]
+
+    if not text.strip("\n"):
+        print(f"Error: '{args.source}' contains no ASCII art")
+        sys.exit(1)
+
+    if args.png:
+        img = ascii_to_png(text, args.png, args.font, args.size, args.foreground, args.background)
+        print(f"Saved to: {args.png} ({img.width}x{img.height})")
+    if args.svg:
+        svg = ascii_to_svg(text, args.svg, args.size, args.foreground, args.background)
+        print(f"Saved to: {args.svg} ({len(svg.encode('utf-8'))} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Packed binary format for ASCII art assets
+4-bit palette indices with run-length encoding, lossless round trip
+
+Layout (little endian):
+    b"ASCP"                 magic
+    u8   version            (1)
+    u8   palette size       (1..16 distinct characters, newline included)
+    u16  palette byte size
+    ...  palette            UTF-8 characters, index order
+    u32  run count
+    u32  extended run count
+    ...  run headers        one byte per run: index << 4 | (length - 1),
+                            low nibble 15 = "length is 16 + next extended entry"
+    ...  extended lengths   u16 per extended run
+
+Runs longer than 16 + 65535 are split, which decodes to the same text. Both
+directions are whole-array NumPy operations; there is no per-character loop.
+
+Usage:
+    python ascii_pack.py pack ascii_art_100.txt lucas_ascii_*.txt
+    python ascii_pack.py unpack ascii_art_100.txt.ascp
+    python ascii_pack.py portraits
+"""
+
+import numpy as np
+import argparse
+import struct
+import sys
+import os
+
+MAGIC = b"ASCP"
+VERSION = 1
+MAX_PALETTE = 16
+MAX_EXTENDED = 0xFFFF
+
+def _codepoints(text):
+    return np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+
+def pack_text(text, verify=True):
+    """
+    Encode text into the packed format
+
+    Args:
+        text: ASCII art with at most 16 distinct characters (newlines count)
+        verify: Decode the result and compare, guaranteeing a lossless round trip
+
+    Returns:
+        Packed bytes
+    """
+    codes = _codepoints(text)
+    palette, indices = np.unique(codes, return_inverse=True)
+    if len(palette) > MAX_PALETTE:
+        raise ValueError(f"{len(palette)} distinct characters; the packed format holds {MAX_PALETTE}")
+
+    if codes.size:
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(indices)) + 1))
+        symbols = indices[starts]
+        lengths = np.diff(np.concatenate((starts, [codes.size])))
+    else:
+        symbols = lengths = np.zeros(0, dtype=np.int64)
+
+    # Split runs the extended field can't hold into several back-to-back runs
+    limit = 16 + MAX_EXTENDED
+    pieces = -(-lengths // limit)
+    if np.any(pieces > 1):
+        symbols = np.repeat(symbols, pieces)
+        split = np.full(symbols.size, limit, dtype=np.int64)
+        last = np.cumsum(pieces) - 1
+        split[last] = lengths - (pieces - 1) * limit
+        lengths = split
+
+    extended = lengths >= 16
+    headers = (symbols.astype(np.uint8) << 4) | np.where(extended, 15, lengths - 1).astype(np.uint8)
+    extra = (lengths[extended] - 16).astype('<u2')
+
+    palette_bytes = palette.astype('<u4').tobytes().decode('utf-32-le').encode('utf-8')
+    packed = b"".join((
+        MAGIC,
+        struct.pack("<BBH", VERSION, len(palette), len(palette_bytes)),
+        palette_bytes,
+        struct.pack("<II", headers.size, extra.size),
+        headers.astype(np.uint8).tobytes(),
+        extra.tobytes(),
+    ))
+
+    if verify and unpack_text(packed) != text:
+        raise ValueError("packed data does not round-trip")
+    return packed
+
+def unpack_text(packed):
+    """Decode bytes produced by pack_text back into the original text"""
+    if packed[:4] != MAGIC:
+        raise ValueError("not a packed ASCII art file")
+    version, palette_size, palette_length = struct.unpack_from("<BBH", packed, 4)
+    if version != VERSION:
+        raise ValueError(f"unsupported packed format version {version}")
+
+    offset = 8
+    palette = _codepoints(packed[offset:offset + palette_length].decode('utf-8'))
+    offset += palette_length
+    run_count, extended_count = struct.unpack_from("<II", packed, offset)
+    offset += 8
+    headers = np.frombuffer(packed, dtype=np.uint8, count=run_count, offset=offset)
+    offset += run_count
+    extra = np.frombuffer(packed, dtype='<u2', count=extended_count, offset=offset)
+
+    lengths = (headers & 15).astype(np.int64) + 1
+    extended = lengths == 16
+    lengths[extended] = extra.astype(np.int64) + 16
+    codes = palette[np.repeat(headers >> 4, lengths)]
+    return codes.astype('<u4').tobytes().decode('utf-32-le')
+
+def portrait_sources():
+    """The hand-drawn portraits that live inside Python modules"""
+    from better_lucas_ascii import get_better_lucas_ascii
+    from enhanced_ascii_converter import create_lucas_portrait_ascii
+    from realistic_lucas_ascii import get_realistic_lucas_ascii
+    return {
+        "better_lucas_ascii": get_better_lucas_ascii(),
+        "realistic_lucas_ascii": get_realistic_lucas_ascii(),
+        "enhanced_ascii_converter": create_lucas_portrait_ascii(),
+    }
+
+def report(name, text, packed):
+    original = len(text.encode('utf-8'))
+    print(f"{name}: {original} -> {len(packed)} bytes ({original / max(1, len(packed)):.1f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack ASCII art into a compact binary format")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack = commands.add_parser("pack", help="write <file>.ascp next to each text file")
+    pack.add_argument("files", nargs="+")
+    unpack = commands.add_parser("unpack", help="print the text of .ascp files")
+    unpack.add_argument("files", nargs="+")
+    portraits = commands.add_parser("portraits", help="pack the portraits defined in Python modules")
+    portraits.add_argument("--out", default=".", help="directory for the .ascp files")
+    args = parser.parse_args()
+
+    if args.command == "unpack":
+        for path in args.files:
+            with open(path, 'rb') as f:
+                sys.stdout.write(unpack_text(f.read()))
+        return
+
+    if args.command == "portraits":
+        sources = portrait_sources()
+    else:
+        sources = {}
+        for path in args.files:
+            if not os.path.exists(path):
+                print(f"Error: file '{path}' not found")
+                sys.exit(1)
+            with open(path, encoding='utf-8') as f:
+                sources[path] = f.read()
+
+    for name, text in sources.items():
+        packed = pack_text(text)
+        output = (os.path.join(args.out, f"{name}.ascp") if args.command == "portraits"
+                  else f"{name}.ascp")
+        with open(output, 'wb') as f:
+            f.write(packed)
+        report(name, text, packed)
+
+if __name__ == "__main__":
+    main()
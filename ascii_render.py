@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Shared NumPy rendering helpers for the ASCII art converters
+Maps a whole grayscale pixel grid to characters in one pass
+"""
+
+import numpy as np
+
+def charset_lut(ascii_chars, invert=False, curve=None):
+    """
+    Build a 256-entry lookup table from pixel value to character code point
+
+    Uses the same bucketing as the original per-pixel loops:
+    index = min(len(ascii_chars) - 1, pixel // (256 // len(ascii_chars)))
+
+    Args:
+        ascii_chars: Characters ordered from index 0 upwards
+        invert: Map 255 - pixel instead of pixel
+        curve: Optional 256-entry tone curve (see tone_curve) applied first,
+            so point operations and charset mapping fuse into one table
+
+    Returns:
+        uint32 array of shape (256,) holding code points
+    """
+    values = np.arange(256) if curve is None else np.asarray(curve, dtype=np.int64)
+    if invert:
+        values = 255 - values
+    indices = np.minimum(len(ascii_chars) - 1, values // (256 // len(ascii_chars)))
+    codepoints = np.array([ord(c) for c in ascii_chars], dtype=np.uint32)
+    return codepoints[indices]
+
+def tone_curve(contrast=1.0, mean=128, gamma=1.0):
+    """
+    Compose contrast and gamma into one 256-entry uint8 point operation
+
+    Contrast reproduces ImageEnhance.Contrast exactly: a blend away from the
+    image mean, truncated and clipped to 0..255. Gamma > 1 lifts midtones.
+
+    Args:
+        contrast: Contrast factor (1.0 leaves pixels unchanged)
+        mean: Mean gray level the contrast blend pivots around
+        gamma: Gamma correction exponent (1.0 leaves pixels unchanged)
+
+    Returns:
+        uint8 array of shape (256,)
+    """
+    values = np.arange(256, dtype=np.float32)
+    values = mean + np.float32(contrast) * (values - mean)
+    values = np.clip(np.trunc(values), 0, 255)
+    if gamma != 1.0:
+        values = np.rint(255 * (values / 255) ** (1 / gamma))
+    return values.astype(np.uint8)
+
+AUTO_LEVELS_MODES = ("levels", "equalize")
+
+def histogram_curve(histogram, mode="levels", clip=0.01):
+    """
+    Derive a 256-entry uint8 tone curve from a 256-bin histogram
+
+    "levels" stretches the range between the clip and 1 - clip quantiles to
+    0..255. "equalize" maps each level through the cumulative distribution
+    so the output spreads evenly across the ramp. Both read only the
+    histogram, never the pixels.
+
+    Args:
+        histogram: 256 bin counts, e.g. img.histogram() for mode 'L'
+        mode: "levels" or "equalize"
+        clip: Fraction of pixels allowed to saturate at each end ("levels" only)
+
+    Returns:
+        uint8 array of shape (256,)
+    """
+    histogram = np.asarray(histogram, dtype=np.float64)
+    total = histogram.sum()
+    if total == 0:
+        return np.arange(256, dtype=np.uint8)
+    cdf = np.cumsum(histogram) / total
+    values = np.arange(256, dtype=np.float64)
+
+    if mode == "equalize":
+        first = cdf[np.flatnonzero(histogram)[0]]
+        if first >= 1:
+            return np.arange(256, dtype=np.uint8)
+        curve = (cdf - first) / (1 - first) * 255
+    else:
+        low = int(np.searchsorted(cdf, clip, side="right"))
+        high = int(np.searchsorted(cdf, 1 - clip, side="left"))
+        if high <= low:
+            return np.arange(256, dtype=np.uint8)
+        curve = (values - low) * 255 / (high - low)
+
+    return np.clip(np.rint(curve), 0, 255).astype(np.uint8)
+
+def render_codepoints(codes):
+    """
+    Join a 2D grid of code points into text, one newline-terminated row per grid row
+
+    Args:
+        codes: 2D array of code points (rows x columns)
+
+    Returns:
+        ASCII art as string
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+    rows = codes.shape[0]
+    grid = np.empty((rows, codes.shape[1] + 1), dtype='<u4')
+    grid[:, :-1] = codes
+    grid[:, -1] = ord("\n")
+    return grid.tobytes().decode('utf-32-le')
+
+def pixels_to_ascii(pixels, lut):
+    """
+    Map a 2D uint8 pixel grid through a charset LUT and render it as text
+
+    Args:
+        pixels: 2D uint8 array (rows x columns), e.g. np.asarray(img) for mode 'L'
+        lut: Table from charset_lut()
+
+    Returns:
+        ASCII art as string
+    """
+    return render_codepoints(lut[np.asarray(pixels, dtype=np.uint8)])
+
+# 4x4 Bayer threshold matrix, values 0..15
+BAYER_4 = np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+])
+
+# Error-diffusion kernels as (dx, dy, weight)
+DIFFUSION_KERNELS = {
+    "floyd-steinberg": ((1, 0, 7 / 16), (-1, 1, 3 / 16), (0, 1, 5 / 16), (1, 1, 1 / 16)),
+    "atkinson": ((1, 0, 1 / 8), (2, 0, 1 / 8), (-1, 1, 1 / 8), (0, 1, 1 / 8),
+                 (1, 1, 1 / 8), (0, 2, 1 / 8)),
+}
+
+DITHER_METHODS = ("bayer",) + tuple(DIFFUSION_KERNELS)
+
+def dither_indices(levels, count, method):
+    """
+    Quantize continuous charset indices with dithering
+
+    Bayer adds a tiled threshold matrix and floors, all in one array
+    operation. Error diffusion has to respect the kernel's dependencies: a
+    cell can only be quantized after every cell that pushes error into it.
+    For both kernels those all lie on earlier anti-diagonals x + 2y, so each
+    step quantizes a whole diagonal at once and scatters its error forward.
+    That gives the same result as the classic serial scan in W + 2H vector
+    steps instead of W * H Python iterations.
+
+    Args:
+        levels: 2D float array of charset indices in [0, count - 1]
+        count: Number of characters in the charset
+        method: "bayer", "floyd-steinberg" or "atkinson"
+
+    Returns:
+        2D int array of charset indices
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    rows, cols = levels.shape
+
+    if method == "bayer":
+        thresholds = (BAYER_4 + 0.5) / 16
+        tiled = np.tile(thresholds, (rows // 4 + 1, cols // 4 + 1))[:rows, :cols]
+        return np.clip(np.floor(levels + tiled), 0, count - 1).astype(np.intp)
+
+    kernel = DIFFUSION_KERNELS[method]
+
+    # Pad so error pushed past the edges lands somewhere harmless
+    pad = 2
+    work = np.zeros((rows + pad, cols + 2 * pad))
+    work[:rows, pad:pad + cols] = levels
+    result = np.empty((rows, cols), dtype=np.intp)
+
+    for step in range(cols + 2 * (rows - 1)):
+        ys = np.arange(max(0, -(-(step - cols + 1) // 2)), min(rows - 1, step // 2) + 1)
+        xs = step - 2 * ys
+        values = work[ys, xs + pad]
+        quantized = np.clip(np.rint(values), 0, count - 1)
+        result[ys, xs] = quantized
+        error = values - quantized
+        for dx, dy, weight in kernel:
+            work[ys + dy, xs + dx + pad] += error * weight
+
+    return result
+
+# Sub-character modes pack several binary pixels into one cell
+
+# Indexed by top + 2 * bottom
+HALF_BLOCKS = np.array([ord(" "), ord("▀"), ord("▄"), ord("█")], dtype=np.uint32)
+
+# Braille dot bit for each (row, column) of the 4x2 cell, added to U+2800
+BRAILLE_BITS = np.array([
+    [0x01, 0x08],
+    [0x02, 0x10],
+    [0x04, 0x20],
+    [0x40, 0x80],
+], dtype=np.uint32)
+
+def half_block_codes(ink):
+    """
+    Pack pairs of vertical pixels into half-block characters
+
+    Args:
+        ink: 2D bool array (2 * rows x columns), True where a pixel is drawn
+
+    Returns:
+        2D array of code points (rows x columns)
+    """
+    ink = np.asarray(ink, dtype=bool)
+    rows = ink.shape[0] // 2
+    return HALF_BLOCKS[ink[0:2 * rows:2].astype(np.intp) + 2 * ink[1:2 * rows:2]]
+
+def braille_codes(ink):
+    """
+    Pack 2x4 pixel blocks into Braille characters (U+2800..U+28FF)
+
+    Args:
+        ink: 2D bool array (4 * rows x 2 * columns), True where a dot is raised
+
+    Returns:
+        2D array of code points (rows x columns)
+    """
+    ink = np.asarray(ink, dtype=bool)
+    rows, cols = ink.shape[0] // 4, ink.shape[1] // 2
+    cells = ink[:4 * rows, :2 * cols].reshape(rows, 4, cols, 2)
+    bits = (cells * BRAILLE_BITS[None, :, None, :]).sum(axis=(1, 3), dtype=np.uint32)
+    return 0x2800 + bits
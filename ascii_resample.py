@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Density-aware resampling of existing ASCII art
+Scales a character grid to any width and height without going back to an image
+
+Every character is mapped to an ink density, the density grid is
+area-averaged to the target size with two weight matrices (Wy @ D @ Wx),
+and the result is mapped back onto a shade ramp.
+
+Usage:
+    python ascii_resample.py better_lucas_ascii --width 40
+    python ascii_resample.py lucas_ascii_desktop.txt --width 30 --height 5
+"""
+
+import numpy as np
+import argparse
+import sys
+import os
+
+from ascii_render import render_codepoints
+
+# Output ramp, densest first
+BLOCK_RAMP = "█▓▒░ "
+
+# Ramps used by the converters, densest first; each spreads evenly over 1..0
+DENSITY_RAMPS = (
+    "█▓▒░ ",
+    "@&#%8XoOx*+=~-:. ",
+    "@%#*+=-:. ",
+)
+
+# Characters outside every ramp (letters, stray punctuation) count as half ink
+DEFAULT_DENSITY = 0.5
+
+def density_table(ramps=DENSITY_RAMPS, default=DEFAULT_DENSITY):
+    """
+    Lookup table from code point to ink density in [0, 1]
+
+    Earlier ramps win when a character appears in several.
+
+    Returns:
+        (sorted uint32 code points, float64 densities, default density)
+    """
+    densities = {}
+    for ramp in ramps:
+        for i, char in enumerate(ramp):
+            densities.setdefault(char, 1 - i / (len(ramp) - 1))
+    codes = np.array(sorted(ord(char) for char in densities), dtype=np.uint32)
+    values = np.array([densities[chr(code)] for code in codes], dtype=np.float64)
+    return codes, values, default
+
+def ascii_densities(text, table=None):
+    """
+    Ink density grid of a block of ASCII art
+
+    Args:
+        text: ASCII art; ragged rows are padded with spaces
+        table: Result of density_table(), built from DENSITY_RAMPS if omitted
+
+    Returns:
+        2D float64 array (rows x widest row)
+    """
+    codes, values, default = table or density_table()
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    width = max((len(line) for line in lines), default=0)
+    padded = "".join(line.ljust(width) for line in lines)
+    grid = np.frombuffer(padded.encode('utf-32-le'), dtype='<u4').reshape(len(lines), width)
+
+    positions = np.clip(np.searchsorted(codes, grid), 0, len(codes) - 1)
+    known = codes[positions] == grid
+    return np.where(known, values[positions], default)
+
+def area_weights(size, target):
+    """
+    (target, size) matrix averaging size cells into target cells by overlap
+
+    Row j holds how much of each source cell falls inside target cell j,
+    divided by the target cell's length in source cells, so every row sums to 1.
+    """
+    scale = size / target
+    low = np.arange(target)[:, None] * scale
+    edges = np.arange(size)[None, :]
+    overlap = np.minimum(edges + 1, low + scale) - np.maximum(edges, low)
+    return np.clip(overlap, 0, None) / scale
+
+def resample_densities(densities, width, height):
+    """Area-average a density grid to (height, width)"""
+    rows, cols = densities.shape
+    return area_weights(rows, height) @ densities @ area_weights(cols, width).T
+
+def densities_to_ascii(densities, ramp=BLOCK_RAMP):
+    """
+    Map a density grid onto a shade ramp
+
+    Args:
+        densities: 2D float array in [0, 1]
+        ramp: Characters from densest to lightest
+
+    Returns:
+        ASCII art as string, trailing spaces stripped from every row
+    """
+    indices = np.rint((1 - np.clip(densities, 0, 1)) * (len(ramp) - 1)).astype(np.intp)
+    codepoints = np.array([ord(char) for char in ramp], dtype=np.uint32)
+    lines = render_codepoints(codepoints[indices]).split("\n")[:-1]
+    return "\n".join(line.rstrip() for line in lines)
+
+def resample_ascii(text, width, height=None, ramp=BLOCK_RAMP, table=None):
+    """
+    Resize ASCII art to a new character grid
+
+    Args:
+        text: Source ASCII art
+        width: Target width in characters
+        height: Target height in characters; keeps the source proportions if omitted
+        ramp: Output characters from densest to lightest
+        table: Custom density_table() for the source characters
+
+    Returns:
+        Resized ASCII art as string; empty when the source has no characters
+    """
+    if width < 1 or (height is not None and height < 1):
+        raise ValueError(f"width and height must be at least 1, got width={width}, height={height}")
+    densities = ascii_densities(text, table)
+    rows, cols = densities.shape
+    if rows == 0 or cols == 0:
+        return ""
+    if height is None:
+        height = max(1, round(rows * width / cols))
+    return densities_to_ascii(resample_densities(densities, width, height), ramp)
+
+def main():
+    parser = argparse.ArgumentParser(description="Resize existing ASCII art")
+    parser.add_argument("source", help="text file, or a portrait name from ascii_pack.portrait_sources()")
+    parser.add_argument("--width", type=int, required=True)
+    parser.add_argument("--height", type=int)
+    parser.add_argument("--ramp", default=BLOCK_RAMP, help="output characters, densest first")
+    args = parser.parse_args()
+
+    if os.path.exists(args.source):
+        with open(args.source, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        from ascii_pack import portrait_sources
+        portraits = portrait_sources()
+        if args.source not in portraits:
+            print(f"Error: '{args.source}' is neither a file nor one of: {', '.join(portraits)}")
+            sys.exit(1)
+        text = portraits[args.source]
+
+    try:
+        print(resample_ascii(text, args.width, args.height, args.ramp))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
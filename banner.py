@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Bitmap banner font for block-letter ASCII art
+Renders any text in the 5-row, 3-stroke letter style of the LUCAS banners
+
+Usage:
+    python banner.py LUCAS
+    python banner.py "SYLLABUS 2025" --fill ▒ --y-scale 2
+    python banner.py LUCAS --letters          # each letter drawn with itself
+"""
+
+from functools import lru_cache
+import argparse
+
+# '#' marks a filled cell. Letters are 8 columns wide with 3-column strokes;
+# narrow glyphs (I, T, 1, punctuation) keep the same stroke weight.
+GLYPHS = {
+    "A": (" ###### ", "###  ###", "########", "###  ###", "###  ###"),
+    "B": ("####### ", "###  ###", "####### ", "###  ###", "####### "),
+    "C": (" ###### ", "###     ", "###     ", "###     ", " ###### "),
+    "D": ("######  ", "###  ###", "###  ###", "###  ###", "######  "),
+    "E": ("########", "###     ", "######  ", "###     ", "########"),
+    "F": ("########", "###     ", "######  ", "###     ", "###     "),
+    "G": (" ###### ", "###     ", "### ####", "###  ###", " ###### "),
+    "H": ("###  ###", "###  ###", "########", "###  ###", "###  ###"),
+    "I": ("#######", "  ###  ", "  ###  ", "  ###  ", "#######"),
+    "J": ("     ###", "     ###", "     ###", "###  ###", " ###### "),
+    "K": ("###  ###", "### ### ", "#####   ", "### ### ", "###  ###"),
+    "L": ("###     ", "###     ", "###     ", "###     ", "########"),
+    "M": ("###  ###", "########", "## ## ##", "###  ###", "###  ###"),
+    "N": ("###  ###", "#### ###", "########", "### ####", "###  ###"),
+    "O": (" ###### ", "###  ###", "###  ###", "###  ###", " ###### "),
+    "P": ("####### ", "###  ###", "####### ", "###     ", "###     "),
+    "Q": (" ###### ", "###  ###", "###  ###", "### ### ", " #### ##"),
+    "R": ("####### ", "###  ###", "####### ", "### ### ", "###  ###"),
+    "S": (" ###### ", "###     ", " ###### ", "     ###", " ###### "),
+    "T": ("#######", "  ###  ", "  ###  ", "  ###  ", "  ###  "),
+    "U": ("###  ###", "###  ###", "###  ###", "###  ###", " ###### "),
+    "V": ("###  ###", "###  ###", "###  ###", " ###### ", "  ####  "),
+    "W": ("###  ###", "###  ###", "## ## ##", "########", "###  ###"),
+    "X": ("###  ###", " ###### ", "  ####  ", " ###### ", "###  ###"),
+    "Y": ("###  ###", "###  ###", " ###### ", "  ####  ", "  ####  "),
+    "Z": ("########", "    ### ", "  ###   ", "###     ", "########"),
+    "0": (" ###### ", "### ####", "########", "#### ###", " ###### "),
+    "1": (" ####  ", "  ###  ", "  ###  ", "  ###  ", "#######"),
+    "2": (" ###### ", "     ###", " ###### ", "###     ", "########"),
+    "3": ("####### ", "     ###", "  ##### ", "     ###", "####### "),
+    "4": ("###  ###", "###  ###", "########", "     ###", "     ###"),
+    "5": ("########", "###     ", "####### ", "     ###", "####### "),
+    "6": (" ###### ", "###     ", "####### ", "###  ###", " ###### "),
+    "7": ("########", "     ###", "    ### ", "   ###  ", "   ###  "),
+    "8": (" ###### ", "###  ###", " ###### ", "###  ###", " ###### "),
+    "9": (" ###### ", "###  ###", " #######", "     ###", " ###### "),
+    " ": ("    ", "    ", "    ", "    ", "    "),
+    ".": ("   ", "   ", "   ", "   ", "###"),
+    ",": ("   ", "   ", "   ", "###", "## "),
+    ":": ("   ", "###", "   ", "###", "   "),
+    "'": ("###", "###", "   ", "   ", "   "),
+    "!": ("###", "###", "###", "   ", "###"),
+    "?": (" ###### ", "###  ###", "    ### ", "        ", "   ###  "),
+    "-": ("      ", "      ", "######", "      ", "      "),
+    "/": ("     ###", "    ### ", "   ###  ", " ###    ", "###     "),
+}
+
+GLYPH_HEIGHT = 5
+
+@lru_cache(maxsize=None)
+def scaled_glyph(char, fill_char="█", x_scale=1, y_scale=1):
+    """
+    Rows of one glyph, filled and scaled
+
+    Args:
+        char: Character from GLYPHS
+        fill_char: Character for filled cells, or None to draw the glyph with itself
+        x_scale: Horizontal repeat factor for every cell
+        y_scale: Vertical repeat factor for every row
+
+    Returns:
+        Tuple of GLYPH_HEIGHT * y_scale strings
+    """
+    fill = char if fill_char is None else fill_char
+    rows = []
+    for row in GLYPHS[char]:
+        scaled = "".join((fill if cell == "#" else " ") * x_scale for cell in row)
+        rows.extend([scaled] * y_scale)
+    return tuple(rows)
+
+def render(text, fill_char="█", x_scale=1, y_scale=1, spacing=2):
+    """
+    Render text as a block-letter banner
+
+    Args:
+        text: Text to render; lowercase letters are drawn as capitals
+        fill_char: Character for filled cells, or None to draw each letter
+            with itself (L from 'L', U from 'U', ...)
+        x_scale: Horizontal repeat factor for every cell
+        y_scale: Vertical repeat factor for every row
+        spacing: Blank columns between glyphs
+
+    Returns:
+        Banner as string, rows joined by newlines
+    """
+    text = text.upper()
+    missing = sorted(set(text) - set(GLYPHS))
+    if missing:
+        raise ValueError(f"No banner glyph for: {''.join(missing)!r}")
+
+    glyphs = [scaled_glyph(char, fill_char, x_scale, y_scale) for char in text]
+    gap = " " * spacing
+    return "\n".join(gap.join(rows) for rows in zip(*glyphs))
+
+def main():
+    parser = argparse.ArgumentParser(description="Render text as a block-letter banner")
+    parser.add_argument("text")
+    parser.add_argument("--fill", default="█", help="character for filled cells")
+    parser.add_argument("--letters", action="store_true", help="draw each letter with itself")
+    parser.add_argument("--x-scale", type=int, default=1)
+    parser.add_argument("--y-scale", type=int, default=1)
+    parser.add_argument("--spacing", type=int, default=2)
+    args = parser.parse_args()
+
+    fill_char = None if args.letters else args.fill
+    print(render(args.text, fill_char, args.x_scale, args.y_scale, args.spacing))
+
+if __name__ == "__main__":
+    main()
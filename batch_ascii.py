@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Batch ASCII Art Converter
+Converts a directory or glob of images in parallel, skipping cached renders
+
+Usage:
+    python batch_ascii.py public/images/books
+    python batch_ascii.py "public/images/**/*.jpg" --converter enhanced --width 100
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import glob
+import os
+import sys
+import time
+
+from ascii_cache import ERROR_PREFIX, RenderCache
+import ascii_converter
+import enhanced_ascii_converter
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
+
+def collect_images(target):
+    """Expand a directory or glob pattern into a sorted list of image paths"""
+    if os.path.isdir(target):
+        candidates = [os.path.join(target, name) for name in os.listdir(target)]
+    else:
+        candidates = glob.glob(target, recursive=True)
+    return sorted(
+        path for path in candidates
+        if os.path.isfile(path) and os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1 (--width, --workers)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def positive_float(value):
+    """argparse type for --height-ratio: a ratio of 0 or less leaves no rows to render"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: '{value}'")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def output_name(path, root):
+    """
+    .txt name for an image: its path under root with the extension kept
+
+    cover.jpg and cover.png, or a/cover.jpg and b/cover.jpg, would otherwise
+    all write cover.txt over each other.
+    """
+    return os.path.relpath(path, root) + ".txt"
+
+def render_params(args):
+    """Every setting that changes the rendered text, in a stable order"""
+    if args.converter == "enhanced":
+        return {
+            "converter": "enhanced",
+            "width": args.width or 70,
+            "height_ratio": 0.45 if args.height_ratio is None else args.height_ratio,
+            "contrast_boost": args.contrast_boost,
+            "ascii_chars": args.charset or enhanced_ascii_converter.ASCII_CHARS,
+        }
+    return {
+        "converter": "basic",
+        "width": args.width or 80,
+        "height_ratio": 0.5 if args.height_ratio is None else args.height_ratio,
+        "ascii_chars": args.charset or ascii_converter.ASCII_CHARS,
+    }
+
+def render(path, params):
+    """Worker entry point: render one image with the chosen converter"""
+    options = {key: value for key, value in params.items() if key != "converter"}
+    if params["converter"] == "enhanced":
+        return enhanced_ascii_converter.image_to_ascii(path, **options)
+    return ascii_converter.image_to_ascii(path, **options)
+
+def read_text(path):
+    """Contents of a text file, or None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def write_text(path, text):
+    """Write text atomically so an interrupted run never leaves a torn file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert many images to ASCII art in parallel")
+    parser.add_argument("target", help="directory or glob pattern of images")
+    parser.add_argument("--converter", choices=["basic", "enhanced"], default="basic")
+    parser.add_argument("--width", type=positive_int, help="characters per row (converter default if omitted)")
+    parser.add_argument("--height-ratio", type=positive_float, help="row/column aspect correction")
+    parser.add_argument("--contrast-boost", type=float, default=1.3, help="enhanced converter only")
+    parser.add_argument("--charset", help="override the converter's character ramp")
+    parser.add_argument("--out", default="ascii_out", help="directory for the .txt results")
+    parser.add_argument("--cache-dir", default=".ascii_cache")
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    images = collect_images(args.target)
+    if not images:
+        print(f"No images found for '{args.target}'")
+        sys.exit(1)
+
+    params = render_params(args)
+    # Outputs mirror the images' layout below the deepest directory they share
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in images])
+    os.makedirs(args.out, exist_ok=True)
+    cache = RenderCache(args.cache_dir)
+    start = time.perf_counter()
+
+    # Hash sources first; anything with a cached render is copied straight out
+    pending = []
+    hits = 0
+    for path in images:
+        key = cache.key(path, params)
+        output_path = os.path.join(args.out, output_name(os.path.abspath(path), root))
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        text = cache.get(key)
+        if text is not None:
+            if read_text(output_path) != text:
+                write_text(output_path, text)
+            hits += 1
+        else:
+            pending.append((path, key, output_path))
+
+    failures = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = pool.map(render, [p[0] for p in pending], [params] * len(pending))
+            for (path, key, output_path), text in zip(pending, results):
+                if text.startswith(ERROR_PREFIX):
+                    print(f"{path}: {text}")
+                    failures += 1
+                    continue
+                cache.put(key, text)
+                write_text(output_path, text)
+                print(f"Rendered: {path}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(images)} images: {hits} cached, {len(pending) - failures} rendered, "
+          f"{failures} failed in {elapsed:.2f}s")
+    print(cache.summary())
+    print(f"Output: {args.out}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
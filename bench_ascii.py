@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the ASCII rendering hot path
+Times ascii_converter / enhanced_ascii_converter on deterministic synthetic images
+
+Each case runs in a fresh worker process so peak RSS belongs to that case
+alone. Wall time is the min/median over several renders (compare gates on
+the min); allocations are the tracemalloc peak of one extra traced render
+(Python and NumPy buffers - PIL's own C allocations only show up in peak RSS).
+
+Usage:
+    python bench_ascii.py run                 # print results
+    python bench_ascii.py save                # run and store as the baseline
+    python bench_ascii.py compare             # run and fail on regressions
+    python bench_ascii.py compare --quick --tolerance 2
+"""
+
+from multiprocessing import get_context
+from PIL import Image
+import numpy as np
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import PIL
+
+BASELINE_PATH = "ascii_bench_baseline.json"
+
+PATTERNS = ("gradient", "noise", "portrait")
+SOURCE_SIZES = ((320, 400), (1200, 1600), (4000, 3000))
+WIDTHS = (60, 100, 200, 400)
+CONVERTERS = ("basic", "enhanced")
+
+QUICK_SOURCE_SIZES = ((320, 400), (1200, 1600))
+QUICK_WIDTHS = (60, 200)
+
+# Compared against the baseline, with the absolute slack below which a change
+# is treated as noise; anything else is informational. Wall time is gated on
+# the fastest repeat - the median moves with whatever else the machine is doing
+METRICS = {"wall_ms_min": 1.0, "alloc_peak_kb": 64.0, "peak_rss_mb": 8.0}
+
+def synthetic_image(pattern, size):
+    """Deterministic RGB test image"""
+    width, height = size
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    u, v = x / width, y / height
+
+    if pattern == "gradient":
+        gray = 255 * (0.6 * u + 0.4 * v)
+        rgb = np.stack([gray, 255 * v, 255 * (1 - u)], axis=-1)
+    elif pattern == "noise":
+        rng = np.random.default_rng(12345)
+        rgb = rng.integers(0, 256, size=(height, width, 3)).astype(np.float32)
+    else:
+        # Dark backdrop, lit oval face, two eye sockets and a soft shadow
+        face = ((u - 0.5) / 0.28) ** 2 + ((v - 0.5) / 0.36) ** 2
+        gray = np.where(face < 1, 200 - 60 * face, 40 + 30 * v)
+        for eye_x in (0.4, 0.6):
+            eye = ((u - eye_x) / 0.05) ** 2 + ((v - 0.42) / 0.03) ** 2
+            gray = np.where(eye < 1, 30, gray)
+        gray = gray - 50 * np.exp(-((u - 0.5) ** 2 + (v - 0.7) ** 2) / 0.01)
+        rgb = np.stack([gray * 1.05, gray, gray * 0.9], axis=-1)
+
+    return Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8), 'RGB')
+
+def build_cases(quick):
+    """All (case_id, converter, pattern, size, width) combinations"""
+    sizes = QUICK_SOURCE_SIZES if quick else SOURCE_SIZES
+    widths = QUICK_WIDTHS if quick else WIDTHS
+    return [
+        (f"{converter}/{pattern}/{w}x{h}/{width}", converter, pattern, (w, h), width)
+        for converter in CONVERTERS
+        for pattern in PATTERNS
+        for (w, h) in sizes
+        for width in widths
+    ]
+
+def peak_rss_mb():
+    """
+    Peak resident set size of this process in megabytes
+
+    Linux keeps ru_maxrss across exec, so a spawned worker would report its
+    parent's peak; VmHWM belongs to the worker's own address space.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_case(converter, image_path, width, repeats):
+    """Worker: time one render configuration and measure its memory"""
+    if converter == "enhanced":
+        from enhanced_ascii_converter import image_to_ascii
+    else:
+        from ascii_converter import image_to_ascii
+
+    image_to_ascii(image_path, width=width)  # warm imports and caches
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        image_to_ascii(image_path, width=width)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    image_to_ascii(image_path, width=width)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_ms_min": round(min(timings), 3),
+        "wall_ms_median": round(statistics.median(timings), 3),
+        "alloc_peak_kb": round(alloc_peak / 1024, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+def run_benchmarks(quick=False, repeats=15, only=None):
+    """Run every case (or just the case ids in only) and return the results document"""
+    cases = [case for case in build_cases(quick) if only is None or case[0] in only]
+    results = {}
+    context = get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for _, _, pattern, size, _ in cases:
+            if (pattern, size) not in paths:
+                path = os.path.join(tmp, f"{pattern}_{size[0]}x{size[1]}.png")
+                synthetic_image(pattern, size).save(path)
+                paths[(pattern, size)] = path
+
+        # One fresh process per case keeps peak RSS attributable
+        with context.Pool(1, maxtasksperchild=1) as pool:
+            for case_id, converter, pattern, size, width in cases:
+                result = pool.apply(run_case, (converter, paths[(pattern, size)], width, repeats))
+                results[case_id] = result
+                print(f"{case_id:<36} {result['wall_ms_min']:>9.2f} ms min  "
+                      f"{result['alloc_peak_kb']:>9.1f} KB alloc  {result['peak_rss_mb']:>7.1f} MB rss")
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pillow": PIL.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "repeats": repeats,
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+def compare(current, baseline, tolerance):
+    """Regressions as (case_id, metric, baseline, current) tuples"""
+    regressions = []
+    for case_id, result in current["results"].items():
+        previous = baseline["results"].get(case_id)
+        if previous is None:
+            continue
+        for metric, floor in METRICS.items():
+            if result[metric] > max(previous[metric] * tolerance, previous[metric] + floor):
+                regressions.append((case_id, metric, previous[metric], result[metric]))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ASCII rendering hot path")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    parser.add_argument("--quick", action="store_true", help="smaller source sizes and widths")
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="fail when a metric exceeds baseline x tolerance")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="re-measure regressed cases this many times before failing")
+    args = parser.parse_args()
+
+    if args.command == "compare" and not os.path.exists(args.baseline):
+        print(f"Error: baseline '{args.baseline}' not found - run 'save' first")
+        sys.exit(1)
+
+    current = run_benchmarks(quick=args.quick, repeats=args.repeats)
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        # A slow phase on a shared machine can hold back every repeat of a
+        # case; keep the best of several runs before calling it a regression
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            print(f"\nRe-measuring {len(regressions)} regressed metric(s)")
+            rerun = run_benchmarks(quick=args.quick, repeats=args.repeats,
+                                   only={case_id for case_id, *_ in regressions})
+            for case_id, result in rerun["results"].items():
+                best = current["results"][case_id]
+                current["results"][case_id] = {metric: min(best[metric], value)
+                                               for metric, value in result.items()}
+            regressions = compare(current, baseline, args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.command == "save":
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nSaved baseline: {args.baseline}")
+
+    elif args.command == "compare":
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance}x:")
+            for case_id, metric, before, after in regressions:
+                print(f"  {case_id} {metric}: {before} -> {after}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance}x of {args.baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Color ASCII Art Converter
+Renders ASCII art as ANSI truecolor escapes or HTML spans with run-length coalescing
+
+Colors are quantized to a palette first, then every run of adjacent cells
+with the same color shares one escape sequence / <span>. Spaces take the
+color of the run they sit in, since their color is never visible.
+"""
+
+from PIL import Image
+import numpy as np
+import argparse
+import html
+import sys
+import os
+
+from ascii_converter import ASCII_CHARS
+from ascii_render import charset_lut
+
+def parse_palette(spec):
+    """Parse '#8b0000,#333333,...' into an (n, 3) uint8 array"""
+    colors = [c.strip().lstrip("#") for c in spec.split(",") if c.strip()]
+    return np.array([[int(c[i:i + 2], 16) for i in (0, 2, 4)] for c in colors], dtype=np.uint8)
+
+def levels_arg(value):
+    """argparse type for --levels: a uniform cube needs at least two levels per channel"""
+    try:
+        levels = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: '{value}'")
+    if levels < 2:
+        raise argparse.ArgumentTypeError(f"must be at least 2, got {levels}")
+    return levels
+
+def quantize_colors(rgb, palette=6):
+    """
+    Quantize an RGB array to a fixed palette
+
+    Args:
+        rgb: uint8 array (..., 3)
+        palette: Levels per channel for a uniform color cube (6 -> 216 colors),
+            or an (n, 3) array of explicit colors matched by nearest distance
+
+    Returns:
+        uint8 array of the same shape holding palette colors
+    """
+    if isinstance(palette, int):
+        if palette < 2:
+            raise ValueError(f"need at least 2 levels per channel, got {palette}")
+        step = 255 / (palette - 1)
+        return (np.rint(np.rint(rgb / step) * step)).astype(np.uint8)
+
+    palette = np.asarray(palette, dtype=np.int32)
+    flat = rgb.reshape(-1, 3).astype(np.int32)
+    distances = ((flat[:, None, :] - palette[None, :, :]) ** 2).sum(axis=2)
+    return palette[distances.argmin(axis=1)].astype(np.uint8).reshape(rgb.shape)
+
+def color_runs(chars, colors):
+    """
+    Split each row into (text, (r, g, b)) runs of equal color
+
+    Args:
+        chars: 2D code point array (rows x cols)
+        colors: Quantized uint8 array (rows x cols x 3)
+
+    Returns:
+        List of rows, each a list of (text, color) tuples
+    """
+    rows, cols = chars.shape
+    packed = (colors[..., 0].astype(np.uint32) << 16) | (colors[..., 1].astype(np.uint32) << 8) | colors[..., 2]
+
+    # Spaces inherit the color to their left so they never split a run
+    visible = chars != ord(" ")
+    source = np.where(visible, np.arange(cols), 0)
+    np.maximum.accumulate(source, axis=1, out=source)
+    packed = np.take_along_axis(packed, source, axis=1)
+
+    result = []
+    for row_chars, row_colors in zip(chars, packed):
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(row_colors)) + 1))
+        ends = np.concatenate((starts[1:], [cols]))
+        text = row_chars.astype('<u4').tobytes().decode('utf-32-le')
+        result.append([
+            (text[start:end], (int(row_colors[start]) >> 16, (int(row_colors[start]) >> 8) & 255,
+                               int(row_colors[start]) & 255))
+            for start, end in zip(starts, ends)
+        ])
+    return result
+
+def format_ansi(runs):
+    """ANSI 24-bit foreground escapes, reset at the end of every row"""
+    lines = []
+    for row in runs:
+        parts = [f"\x1b[38;2;{r};{g};{b}m{text}" for text, (r, g, b) in row]
+        lines.append("".join(parts) + "\x1b[0m")
+    return "\n".join(lines) + "\n"
+
+def format_html(runs):
+    """<span style="color:#rrggbb"> markup, one line per row, for embedding in a <pre>"""
+    lines = []
+    for row in runs:
+        parts = [f'<span style="color:#{r:02x}{g:02x}{b:02x}">{html.escape(text)}</span>'
+                 for text, (r, g, b) in row]
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
+
+def format_ansi_half_blocks(rgb, palette=6):
+    """
+    Truecolor half-block rendering: every cell is '▀' with the top pixel as
+    foreground and the bottom pixel as background, so each cell shows two
+    full-color pixels. Cells whose color pair repeats share one escape.
+
+    Args:
+        rgb: uint8 array (2 * rows x cols x 3)
+        palette: Levels per channel, or an (n, 3) array of explicit colors
+
+    Returns:
+        ANSI string, one reset-terminated line per cell row
+    """
+    colors = quantize_colors(rgb, palette).astype(np.uint32)
+    packed = (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+    rows = packed.shape[0] // 2
+    top, bottom = packed[0:2 * rows:2], packed[1:2 * rows:2]
+    pairs = (top.astype(np.uint64) << 24) | bottom
+
+    lines = []
+    for row_top, row_bottom, row_pairs in zip(top, bottom, pairs):
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(row_pairs)) + 1))
+        ends = np.concatenate((starts[1:], [row_pairs.size]))
+        parts = []
+        for start, end in zip(starts, ends):
+            fg, bg = int(row_top[start]), int(row_bottom[start])
+            parts.append(f"\x1b[38;2;{fg >> 16};{(fg >> 8) & 255};{fg & 255}"
+                         f";48;2;{bg >> 16};{(bg >> 8) & 255};{bg & 255}m" + "▀" * (end - start))
+        lines.append("".join(parts) + "\x1b[0m")
+    return "\n".join(lines) + "\n"
+
+def image_to_color_ascii(image_path, width=80, height_ratio=0.5, mode="ansi", palette=6,
+                         ascii_chars=ASCII_CHARS):
+    """
+    Convert an image to colored ASCII art
+
+    Args:
+        image_path: Path to the input image
+        width: Target width in characters
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        mode: "ansi" for terminals or "html" for <span> markup
+        palette: Levels per channel, or an (n, 3) array of explicit colors
+        ascii_chars: Characters for grayscale mapping (darkest to lightest)
+
+    Returns:
+        Colored ASCII art as string
+    """
+
+    try:
+        img = Image.open(image_path)
+
+        original_width, original_height = img.size
+        aspect_ratio = original_height / original_width
+        new_height = int(aspect_ratio * width * height_ratio)
+
+        # Characters come from the same grayscale path as ascii_converter
+        gray = img.convert('L').resize((width, new_height))
+        rgb = np.asarray(img.convert('RGB').resize((width, new_height)))
+
+        chars = charset_lut(ascii_chars)[np.asarray(gray)]
+        runs = color_runs(chars, quantize_colors(rgb, palette))
+
+        return format_html(runs) if mode == "html" else format_ansi(runs)
+
+    except Exception as e:
+        return f"Error processing image: {str(e)}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert an image to color ASCII art")
+    parser.add_argument("image_path")
+    parser.add_argument("--mode", choices=["ansi", "html"], default="ansi")
+    parser.add_argument("--width", type=int, default=80)
+    parser.add_argument("--levels", type=levels_arg, default=6, help="quantization levels per channel")
+    parser.add_argument("--palette", help="explicit palette, e.g. '#8b0000,#333333,#e8e8d8'")
+    parser.add_argument("--output", help="write to a file instead of stdout")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.image_path):
+        print(f"Error: Image file '{args.image_path}' not found")
+        sys.exit(1)
+
+    palette = parse_palette(args.palette) if args.palette else args.levels
+    art = image_to_color_ascii(args.image_path, width=args.width, mode=args.mode, palette=palette)
+
+    if args.output:
+        with open(args.output, 'w', encoding="utf-8") as f:
+            f.write(art)
+        print(f"Saved to: {args.output} ({len(art.encode('utf-8'))} bytes)")
+    else:
+        sys.stdout.write(art)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Responsive derivatives for book covers
+Writes several widths of every catalog cover as AVIF and WebP, plus one progressive JPEG
+
+Sources are the coverUrl files in app/data/books.ts. Derivatives go to
+public/images/books/derived/<name>-<width>.<ext>, never wider than the
+source, and app/data/bookCovers.ts maps each coverUrl to the srcset strings
+the <BookCover> component renders. AVIF is skipped when this Pillow build
+can't encode it. Files in the derived directory that no cover produces any
+more are deleted.
+
+Covers whose source bytes and encoder settings haven't changed since the last
+run, and whose derivatives are all still on disk, are skipped (see
+cover_manifest.py), so re-runs only touch new covers.
+
+Usage:
+    python cover_derivatives.py
+    python cover_derivatives.py --force
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from PIL import Image, ImageOps, features
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from cover_manifest import CoverManifest, input_hash
+from generate_book_covers import BOOKS_FILE, PUBLIC_DIR, ROOT, cover_path, parse_books
+
+DERIVED_DIR = os.path.join(PUBLIC_DIR, "images", "books", "derived")
+TS_MODULE = os.path.join(ROOT, "app", "data", "bookCovers.ts")
+
+# Grid thumbnails are 64 CSS px wide (1x-2x) and the detail page tops out at
+# 384; the derivatives are committed, so there is no 768 px tier
+WIDTHS = (96, 192, 384)
+
+# Single-width JPEG for browsers without WebP, used as the <img> src
+FALLBACK_WIDTH = 384
+
+# format -> (file extension, MIME type, save options)
+FORMATS = {
+    "avif": ("avif", "image/avif", {"quality": 55, "speed": 6}),
+    "webp": ("webp", "image/webp", {"quality": 78, "method": 5}),
+    "jpeg": ("jpg", "image/jpeg", {"quality": 80, "progressive": True, "optimize": True}),
+}
+
+# Bump whenever resizing or encoding changes
+DERIVATIVE_VERSION = 2
+
+def available_formats():
+    """Formats this Pillow build can encode, best compression first"""
+    return [name for name in FORMATS if name != "avif" or features.check("avif")]
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def derivative_widths(source_width):
+    """Target widths for a source, never upscaling; tiny sources keep their own width"""
+    widths = [width for width in WIDTHS if width <= source_width]
+    return widths or [source_width]
+
+def derivative_url(path):
+    return "/" + os.path.relpath(path, PUBLIC_DIR).replace(os.sep, "/")
+
+def entry_paths(entry):
+    """Every derivative file a bookCovers.ts entry points at"""
+    urls = [entry["src"]]
+    for srcset in entry["sources"].values():
+        urls.extend(candidate.split(" ")[0] for candidate in srcset.split(", "))
+    return [os.path.join(PUBLIC_DIR, *url.lstrip("/").split("/")) for url in urls]
+
+def derivative_path(source_path, width, image_format):
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(DERIVED_DIR, f"{name}-{width}.{FORMATS[image_format][0]}")
+
+def build_derivatives(job):
+    """
+    Worker entry point: decode one cover once and encode every width and format
+
+    Returns:
+        (source path, entry for the TS module, bytes written, error or None)
+    """
+    source_path, formats = job
+    try:
+        with Image.open(source_path) as img:
+            img = ImageOps.exif_transpose(img).convert("RGB")
+        width, height = img.size
+
+        widths = derivative_widths(width)
+        fallback_width = max(w for w in widths if w <= FALLBACK_WIDTH)
+
+        sources = {}
+        src = None
+        written = 0
+        # Widest first, each level resized from the one above it
+        level = img
+        for target in sorted(widths, reverse=True):
+            size = (target, max(1, round(height * target / width)))
+            if level.size != size:
+                level = level.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            for image_format in formats:
+                if image_format == "jpeg" and target != fallback_width:
+                    continue
+                output_path = derivative_path(source_path, target, image_format)
+                tmp_path = f"{output_path}.tmp"
+                level.save(tmp_path, image_format.upper(), **FORMATS[image_format][2])
+                os.replace(tmp_path, output_path)
+                written += os.path.getsize(output_path)
+                if image_format == "jpeg":
+                    src = derivative_url(output_path)
+                else:
+                    sources.setdefault(image_format, []).append(f"{derivative_url(output_path)} {target}w")
+
+        entry = {
+            "width": width,
+            "height": height,
+            "sources": {image_format: ", ".join(reversed(urls)) for image_format, urls in sources.items()},
+            "src": src,
+        }
+        return source_path, entry, written, None
+    except Exception as e:
+        return source_path, None, 0, str(e)
+
+def write_ts_module(entries, path=TS_MODULE):
+    """Write coverUrl -> srcset data for <BookCover>"""
+    lines = [
+        "// Generated by cover_derivatives.py - do not edit by hand.",
+        "",
+        "export interface CoverDerivatives {",
+        "  /** Intrinsic size of the source cover */",
+        "  width: number;",
+        "  height: number;",
+        "  /** srcset strings by format, narrowest first */",
+        "  sources: { avif?: string; webp: string };",
+        "  /** Progressive JPEG for browsers without WebP */",
+        "  src: string;",
+        "}",
+        "",
+        "export const bookCovers: Record<string, CoverDerivatives> = "
+        + json.dumps(dict(sorted(entries.items())), indent=2, ensure_ascii=False) + ";",
+    ]
+    content = "\n".join(lines) + "\n"
+
+    # Leave the module untouched when nothing changed
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Build responsive cover derivatives")
+    parser.add_argument("--books", default=BOOKS_FILE, help="catalog to read")
+    parser.add_argument("--force", action="store_true", help="re-encode every cover")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with open(args.books, encoding="utf-8") as f:
+        books = parse_books(f.read())
+
+    formats = available_formats()
+    if "avif" not in formats:
+        print("AVIF encoding not available in this Pillow build; writing WebP and JPEG only")
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+
+    manifest = CoverManifest("derivatives")
+    previous = {}
+    if os.path.exists(TS_MODULE):
+        with open(TS_MODULE, encoding="utf-8") as f:
+            source = f.read()
+        previous = json.loads(source[source.index("= {") + 2:source.rindex(";")])
+
+    # Unique existing sources; a missing cover is generate_book_covers.py's job
+    cover_urls = {}
+    for book in books:
+        path = cover_path(book)
+        if os.path.exists(path):
+            cover_urls.setdefault(book["coverUrl"], path)
+        else:
+            print(f"Missing cover: {book['coverUrl']} ({book['title']})")
+
+    entries = {}
+    digests = {}
+    jobs = []
+    for cover_url, path in cover_urls.items():
+        digests[path] = input_hash(source=file_digest(path), widths=WIDTHS, formats=formats,
+                                   fallback_width=FALLBACK_WIDTH,
+                                   settings={name: FORMATS[name][2] for name in formats},
+                                   version=DERIVATIVE_VERSION)
+        entry = previous.get(cover_url)
+        if (not args.force and entry and manifest.is_current(path, digests[path])
+                and all(os.path.exists(derived) for derived in entry_paths(entry))):
+            entries[cover_url] = entry
+        else:
+            jobs.append((path, formats))
+
+    start = time.perf_counter()
+    failures = 0
+    source_bytes = derived_bytes = 0
+    if jobs:
+        urls = {path: cover_url for cover_url, path in cover_urls.items()}
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(jobs))) as pool:
+            futures = [pool.submit(build_derivatives, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                path, entry, written, error = future.result()
+                if error:
+                    failures += 1
+                    print(f"[{done}/{len(jobs)}] Failed: {path}: {error}")
+                    continue
+                entries[urls[path]] = entry
+                manifest.record(path, digests[path])
+                source_bytes += os.path.getsize(path)
+                derived_bytes += written
+                print(f"[{done}/{len(jobs)}] {urls[path]}: {len(entry['sources'])} formats")
+
+    # This script owns the derived directory: drop files no current cover produces
+    expected = {os.path.basename(path) for entry in entries.values() for path in entry_paths(entry)}
+    for name in sorted(set(os.listdir(DERIVED_DIR)) - expected):
+        os.remove(os.path.join(DERIVED_DIR, name))
+        print(f"Removed orphaned: {os.path.join(DERIVED_DIR, name)}")
+    manifest.orphans(cover_urls.values())
+
+    module_written = write_ts_module(entries)
+    manifest.save()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(cover_urls)} covers: {len(jobs) - failures} encoded, "
+          f"{len(cover_urls) - len(jobs)} unchanged, {failures} failed in {elapsed:.2f}s")
+    if jobs:
+        print(f"Sources {source_bytes / 1024:.0f} KB -> all derivatives {derived_bytes / 1024:.0f} KB")
+    if module_written:
+        print(f"Wrote {os.path.relpath(TS_MODULE, ROOT)}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
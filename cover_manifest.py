@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Input-hash manifest for generated cover images
+Lets the cover generators skip covers whose inputs haven't changed
+
+Each generator owns one section of cover_manifest.json mapping output path
+(relative to the repo root) to a hash of everything that went into the
+image. A run that changes nothing reads the manifest, hashes the inputs and
+stats the outputs, and writes nothing at all, so file mtimes and Next.js
+image caches stay warm.
+"""
+
+import hashlib
+import json
+import os
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(ROOT, "cover_manifest.json")
+
+def input_hash(**inputs):
+    """Stable hash of a cover's inputs (title, author, palette, size, version, ...)"""
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+class CoverManifest:
+    """
+    One generator's section of the manifest
+
+    Args:
+        section: Generator name, e.g. "books" or "syllabus"
+        path: Manifest file shared by all generators
+    """
+
+    def __init__(self, section, path=MANIFEST_PATH):
+        self.section = section
+        self.path = path
+        self.document = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.document = json.load(f)
+        self.saved = dict(self.document.get(section, {}))
+        self.entries = dict(self.saved)
+
+    def _key(self, output_path):
+        return os.path.relpath(os.path.abspath(output_path), ROOT)
+
+    def recorded(self, output_path):
+        """True if this generator produced the file (so it may regenerate it)"""
+        return self._key(output_path) in self.entries
+
+    def is_current(self, output_path, digest):
+        """True if the file exists and was built from exactly these inputs"""
+        return self.entries.get(self._key(output_path)) == digest and os.path.exists(output_path)
+
+    def record(self, output_path, digest):
+        self.entries[self._key(output_path)] = digest
+
+    def orphans(self, output_paths):
+        """
+        Files this generator built that no current input produces
+
+        Entries whose file is already gone are dropped instead of reported.
+        """
+        current = {self._key(path) for path in output_paths}
+        orphans = []
+        for key in sorted(set(self.entries) - current):
+            if os.path.exists(os.path.join(ROOT, key)):
+                orphans.append(key)
+            else:
+                del self.entries[key]
+        return orphans
+
+    def save(self):
+        """Write the manifest, only if this section changed"""
+        if self.entries == self.saved:
+            return False
+        self.document[self.section] = dict(sorted(self.entries.items()))
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.document.items())), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.saved = dict(self.entries)
+        return True
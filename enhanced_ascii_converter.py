@@ -4,70 +4,156 @@ Enhanced ASCII Art Converter for high-fidelity terminal output
 Optimized for Lucas's A-OK portrait
 """
 
-from PIL import Image, ImageEnhance, ImageFilter
+from functools import lru_cache
+from PIL import Image, ImageFilter
+import numpy as np
 import sys
 import os
 
-def image_to_ascii(image_path, width=70, height_ratio=0.45, contrast_boost=1.3):
+from ascii_converter import ASCII_CHARS as CLASSIC_CHARS, load_grayscale_bounded
+from ascii_render import (charset_lut, dither_indices, histogram_curve, pixels_to_ascii,
+                          render_codepoints, tone_curve)
+
+# Comprehensive ASCII character set for better grayscale depth
+# From darkest to lightest with more variation
+ASCII_CHARS = "@&#%8XoOx*+=~-:. "
+
+# Ramps used across the site, densest first
+CHARSETS = {
+    "classic": CLASSIC_CHARS,
+    "enhanced": ASCII_CHARS,
+    "blocks": "█▓▒░ ",
+}
+
+def point_curve(contrast_boost, mean, gamma, levels=None):
+    """Auto-levels (optional), then contrast and gamma, as one uint8 curve"""
+    tone = tone_curve(contrast_boost, mean, gamma)
+    return tone if levels is None else tone[levels]
+
+@lru_cache(maxsize=256)
+def fused_lut(ascii_chars, contrast_boost, mean, gamma, levels_key=None):
+    """
+    Auto-levels, contrast, gamma, inversion and charset mapping as one 256-entry table
+
+    Built once per parameter set; mean is the image's mean gray level after
+    auto-levels, and levels_key is the auto-levels curve as bytes (or None).
+    """
+    levels = None if levels_key is None else np.frombuffer(levels_key, dtype=np.uint8)
+    return charset_lut(ascii_chars, invert=True, curve=point_curve(contrast_boost, mean, gamma, levels))
+
+def prepare_grayscale(image_path, width, height_ratio, auto_levels=None):
+    """
+    Decode, resize and denoise an image down to the output grid
+    
+    Resizing runs first so the blur and every point operation touch only the
+    output-sized buffer.
+    
+    Returns:
+        (uint8 pixel array, mean gray level after auto-levels, auto-levels curve or None)
+    """
+    
+    # Decode to a small grayscale buffer (JPEG DCT scaling, banded reduction)
+    img, aspect_ratio = load_grayscale_bounded(image_path, width, height_ratio, oversample=4)
+    reduced_width = img.width
+    
+    # Calculate dimensions maintaining aspect ratio
+    new_height = int(aspect_ratio * width * height_ratio)
+    
+    # Resize with high-quality resampling
+    img = img.resize((width, new_height), Image.Resampling.LANCZOS)
+    
+    # The 0.5px noise blur, scaled to the output grid; at real downscale
+    # factors LANCZOS has already averaged that noise away
+    blur_radius = 0.5 * width / reduced_width
+    if blur_radius >= 0.1:
+        img = img.filter(ImageFilter.GaussianBlur(blur_radius))
+    
+    # One 256-bin histogram drives auto-levels and the contrast pivot
+    histogram = np.asarray(img.histogram(), dtype=np.float64)
+    levels = None
+    if auto_levels:
+        levels = histogram_curve(histogram, auto_levels)
+        histogram = np.bincount(levels, weights=histogram, minlength=256)
+    mean = int(histogram @ np.arange(256) / max(1, histogram.sum()) + 0.5)
+    
+    return np.asarray(img), mean, levels
+
+def image_to_ascii(image_path, width=70, height_ratio=0.45, contrast_boost=1.3,
+                   ascii_chars=ASCII_CHARS, dither=None, gamma=1.0, auto_levels=None):
     """
     Convert image to high-fidelity ASCII art
     
+    Contrast, gamma, inversion and charset mapping are applied in a single
+    pass through fused_lut().
+    
     Args:
         image_path: Path to input image
         width: Target width in characters
         height_ratio: Aspect ratio adjustment for terminal display
         contrast_boost: Enhance contrast for better ASCII mapping
+        ascii_chars: Character ramp, densest first
+        dither: None, "bayer", "floyd-steinberg" or "atkinson" to dither
+            between neighbouring characters instead of hard banding
+        gamma: Gamma correction applied after contrast (> 1 lifts midtones)
+        auto_levels: None, "levels" or "equalize" to stretch the histogram
+            before contrast, so contrast_boost needs no per-image tuning
     
     Returns:
         ASCII art as string
     """
     
-    # Comprehensive ASCII character set for better grayscale depth
-    # From darkest to lightest with more variation
-    ascii_chars = "@&#%8XoOx*+=~-:. "
-    
     try:
-        # Open and process image
-        img = Image.open(image_path)
-        
-        # Convert to grayscale
-        img = img.convert('L')
-        
-        # Enhance contrast for better ASCII conversion
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(contrast_boost)
-        
-        # Slight blur to reduce noise
-        img = img.filter(ImageFilter.GaussianBlur(0.5))
-        
-        # Calculate dimensions maintaining aspect ratio
-        original_width, original_height = img.size
-        aspect_ratio = original_height / original_width
-        new_height = int(aspect_ratio * width * height_ratio)
-        
-        # Resize with high-quality resampling
-        img = img.resize((width, new_height), Image.Resampling.LANCZOS)
+        pixels, mean, levels = prepare_grayscale(image_path, width, height_ratio, auto_levels)
         
-        # Convert pixels to ASCII
-        pixels = img.getdata()
-        ascii_str = ""
+        if dither:
+            # Dither in charset-index space: 0 is the first character
+            tone = point_curve(contrast_boost, mean, gamma, levels)
+            inverted = 255 - tone[pixels].astype(np.float64)
+            index_levels = inverted * (len(ascii_chars) - 1) / 255
+            indices = dither_indices(index_levels, len(ascii_chars), dither)
+            codepoints = np.array([ord(c) for c in ascii_chars], dtype=np.uint32)
+            return render_codepoints(codepoints[indices])
         
-        for i, pixel in enumerate(pixels):
-            # Improved mapping with better distribution
-            # Invert pixel value so dark areas use dense characters
-            inverted_pixel = 255 - pixel
-            ascii_index = min(len(ascii_chars) - 1, inverted_pixel // (256 // len(ascii_chars)))
-            ascii_str += ascii_chars[ascii_index]
-            
-            # Add newline at end of each row
-            if (i + 1) % width == 0:
-                ascii_str += "\n"
-        
-        return ascii_str
+        # Map every pixel through the fused lookup table at once
+        levels_key = None if levels is None else levels.tobytes()
+        lut = fused_lut(ascii_chars, contrast_boost, mean, gamma, levels_key)
+        return pixels_to_ascii(pixels, lut)
         
     except Exception as e:
         return f"Error processing image: {str(e)}"
 
+def luminance_grid(image_path, width=70, height_ratio=0.45, contrast_boost=1.3, gamma=1.0,
+                   auto_levels=None):
+    """
+    Normalized luminance for every output cell, before any charset is applied
+    
+    Returns:
+        2D uint8 array (rows x width) after auto-levels, contrast and gamma
+    """
+    pixels, mean, levels = prepare_grayscale(image_path, width, height_ratio, auto_levels)
+    return point_curve(contrast_boost, mean, gamma, levels)[pixels]
+
+def image_to_ascii_charsets(image_path, charsets=CHARSETS, width=70, height_ratio=0.45,
+                            contrast_boost=1.3, gamma=1.0, auto_levels=None, invert=True):
+    """
+    Render one image with several charsets from a single quantization pass
+    
+    The image is decoded, enhanced and resized once by luminance_grid();
+    each charset after that costs one 256-entry table and an index remap.
+    
+    Args:
+        image_path: Path to input image
+        charsets: Dict of name -> character ramp, densest first
+        invert: Dense characters for bright areas, as image_to_ascii() does
+        (other arguments as for image_to_ascii)
+    
+    Returns:
+        Dict of name -> ASCII art string
+    """
+    grid = luminance_grid(image_path, width, height_ratio, contrast_boost, gamma, auto_levels)
+    return {name: pixels_to_ascii(grid, charset_lut(chars, invert=invert))
+            for name, chars in charsets.items()}
+
 def create_lucas_portrait_ascii():
     """
     Create ASCII art specifically for Lucas's A-OK portrait
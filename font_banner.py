@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+TrueType Block Banner
+Rasterizes text with any TTF/OTF/WOFF2 font and maps ink coverage to █▓▒ cells
+
+Each glyph is rasterized once per (font, size) and cached as a coverage
+bitmap with its offset from the pen, so long strings and repeated renders
+only composite arrays.
+
+Usage:
+    python font_banner.py LUCAS
+    python font_banner.py "Syllabus" --font public/fonts/SourceSerif4-latin.woff2 --size 32
+"""
+
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import argparse
+import os
+
+from ascii_render import render_codepoints
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "fonts")
+FONT_PATH = os.path.join(FONTS_DIR, "Inter-latin.woff2")
+
+# Cell characters from full to light ink, and the coverage each one needs
+SHADES = "█▓▒"
+THRESHOLDS = (0.75, 0.5, 0.25)
+
+@lru_cache(maxsize=32)
+def load_font(font_path, size):
+    """FreeType face for a font file at a pixel size, loaded once per process"""
+    return ImageFont.truetype(font_path, size)
+
+@lru_cache(maxsize=4096)
+def glyph_bitmap(char, font_path=FONT_PATH, size=24):
+    """
+    Ink coverage of one character and where it sits relative to the pen
+
+    The bitmap spans the line box (one advance wide, ascent + descent tall)
+    or the glyph's ink box, whichever reaches further, so strokes that
+    overhang the advance - a serif f, the tail of j - are kept.
+
+    Args:
+        char: Single character
+        font_path: TTF/OTF/WOFF2 font file
+        size: Font size in pixels
+
+    Returns:
+        (read-only float32 array with values in [0, 1], x offset of its first
+        column from the pen position, y offset of its first row from the top
+        of the line box, advance in pixels)
+    """
+    font = load_font(font_path, size)
+    ascent, descent = font.getmetrics()
+    advance = max(1, round(font.getlength(char)))
+    left, top, right, bottom = font.getbbox(char)
+    x0, y0 = min(0, left), min(0, top)
+    x1, y1 = max(advance, right), max(ascent + descent, bottom)
+
+    canvas = Image.new('L', (x1 - x0, y1 - y0), 0)
+    ImageDraw.Draw(canvas).text((-x0, -y0), char, font=font, fill=255)
+    coverage = np.asarray(canvas, dtype=np.float32) / 255
+    coverage.flags.writeable = False
+    return coverage, x0, y0, advance
+
+def rasterize(text, font_path=FONT_PATH, size=24):
+    """
+    Coverage bitmap for a line of text, built from cached glyph bitmaps
+
+    Glyphs are placed at their pen positions and overlapping ink is merged
+    with np.maximum, so neighbours never clip each other's overhangs.
+    """
+    font = load_font(font_path, size)
+    line_height = sum(font.getmetrics())
+    if not text:
+        return np.zeros((line_height, 0), dtype=np.float32)
+
+    glyphs = [glyph_bitmap(char, font_path, size) for char in text]
+    pens = np.cumsum([0] + [advance for *_, advance in glyphs])
+    left = min(0, min(pen + x0 for pen, (_, x0, _, _) in zip(pens, glyphs)))
+    right = max(pens[-1], max(pen + x0 + bitmap.shape[1]
+                              for pen, (bitmap, x0, _, _) in zip(pens, glyphs)))
+    top = min(0, min(y0 for _, _, y0, _ in glyphs))
+    bottom = max(line_height, max(y0 + bitmap.shape[0] for bitmap, _, y0, _ in glyphs))
+
+    canvas = np.zeros((bottom - top, right - left), dtype=np.float32)
+    for pen, (bitmap, x0, y0, _) in zip(pens, glyphs):
+        x, y = pen + x0 - left, y0 - top
+        region = canvas[y:y + bitmap.shape[0], x:x + bitmap.shape[1]]
+        np.maximum(region, bitmap, out=region)
+    return canvas
+
+def render(text, font_path=FONT_PATH, size=24, height_ratio=0.5, thresholds=THRESHOLDS,
+           shades=SHADES):
+    """
+    Render text as a block banner in a TrueType font
+
+    Args:
+        text: Single line of text
+        font_path: TTF/OTF/WOFF2 font file, e.g. one from public/fonts
+        size: Font size in pixels (roughly the banner height before height_ratio)
+        height_ratio: Rows per pixel row (terminal cells are about twice as tall as wide)
+        thresholds: Minimum coverage for each shade, highest first
+        shades: Characters for each threshold, fullest first
+
+    Returns:
+        Banner as string, blank rows above and below the ink trimmed
+    """
+    coverage = rasterize(text, font_path, size)
+    if coverage.size == 0:
+        return ""
+
+    # Area-average pixel rows into character rows
+    rows = max(1, round(coverage.shape[0] * height_ratio))
+    img = Image.fromarray(coverage, mode='F').resize((coverage.shape[1], rows), Image.Resampling.BOX)
+    cells = np.asarray(img)
+
+    inked = np.flatnonzero((cells >= thresholds[-1]).any(axis=1))
+    if inked.size == 0:
+        return ""
+    cells = cells[inked[0]:inked[-1] + 1]
+
+    # Count how many thresholds each cell clears: 0 -> space, 1 -> lightest shade ...
+    palette = np.array([ord(c) for c in " " + shades[::-1]], dtype=np.uint32)
+    levels = (cells[..., None] >= np.array(thresholds[::-1])).sum(axis=-1)
+    return render_codepoints(palette[levels]).rstrip("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Render text as a block banner in a TrueType font")
+    parser.add_argument("text")
+    parser.add_argument("--font", default=FONT_PATH, help="TTF/OTF/WOFF2 font file")
+    parser.add_argument("--size", type=int, default=24, help="font size in pixels")
+    parser.add_argument("--height-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(render(args.text, args.font, args.size, args.height_ratio))
+
+if __name__ == "__main__":
+    main()
@@ -2,40 +2,120 @@
 """
 Generate book cover placeholder images for CV site.
 Creates professional-looking book cover images with titles and authors.
+
+Reads the catalog from app/data/books.ts and renders, in parallel, a cover
+for every entry whose coverUrl file doesn't exist yet. Covers this script
+generated are recorded in cover_manifest.json with a hash of their inputs
+and are regenerated only when those inputs change.
+
+Usage:
+    python generate_book_covers.py                 # fill in missing covers
+    python generate_book_covers.py --dry-run       # list what's missing
+    python generate_book_covers.py --all --out /tmp/covers
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import argparse
+import json
+import re
+import sys
 import textwrap
+import time
 import os
 
-def create_book_cover(title, author, filename, width=400, height=600):
-    """Create a book cover image with title and author."""
-    
-    # Create a new image with a gradient background
-    img = Image.new('RGB', (width, height), color='#2c3e50')
-    draw = ImageDraw.Draw(img)
+from cover_manifest import CoverManifest, input_hash
+
+# Bump whenever the drawing code changes what a cover looks like
+GENERATOR_VERSION = 1
+
+# Gradient top color, gradient bottom color, border color
+COVER_PALETTE = ((44, 64, 74), (64, 84, 94), '#34495e')
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT, "public")
+FONTS_DIR = os.path.join(PUBLIC_DIR, "fonts")
+BOOKS_FILE = os.path.join(ROOT, "app", "data", "books.ts")
+
+# Searched in order; the first font FreeType can open is used for every cover.
+# Helvetica and Arial come first so macOS/Windows output stays as it was;
+# the vendored site fonts make Linux builds match each other.
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "arial.ttf",
+    os.path.join(FONTS_DIR, "Inter-latin.woff2"),
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+)
+
+@lru_cache(maxsize=None)
+def resolve_font_path(family=None):
+    """
+    Find a usable font file once per process.
+    family picks a vendored face from public/fonts (e.g. "SourceSerif4");
+    None searches FONT_CANDIDATES. Returns None when nothing loads.
+    """
+    candidates = FONT_CANDIDATES
+    if family:
+        candidates = (os.path.join(FONTS_DIR, f"{family}-latin.woff2"),) + candidates
+    for path in candidates:
+        try:
+            ImageFont.truetype(path, 12)
+            return path
+        except OSError:
+            continue
+    return None
+
+@lru_cache(maxsize=None)
+def get_font(size, family=None):
+    """FreeType font at a pixel size, loaded once per (family, size)."""
+    path = resolve_font_path(family)
+    if path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=4096)
+def text_width(text, size, family=None):
+    """Rendered width of a line of text, memoized per (font, size, string)."""
+    bbox = get_font(size, family).getbbox(text)
+    return bbox[2] - bbox[0]
+
+@lru_cache(maxsize=8)
+def cover_template(width=400, height=600, palette=COVER_PALETTE):
+    """
+    Gradient background and border shared by every cover of one size.
+    Built once per (width, height, palette); callers draw on a copy.
+    """
+    top, bottom, border = palette
     
-    # Create a subtle gradient effect
-    for i in range(height):
-        color_value = int(44 + (i / height) * 20)  # Gradient from #2c3e50 to slightly lighter
-        draw.line([(0, i), (width, i)], fill=(color_value, color_value + 20, color_value + 30))
+    # Subtle vertical gradient, one color per row, truncated like int()
+    fraction = np.arange(height)[:, None] / height
+    top = np.array(top, dtype=np.float64)
+    rows = (top + fraction * (np.array(bottom) - top)).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    img = Image.fromarray(pixels, 'RGB')
     
     # Add a decorative border
     border_width = 10
-    draw.rectangle([border_width, border_width, width - border_width, height - border_width], 
-                  outline='#34495e', width=3)
+    ImageDraw.Draw(img).rectangle([border_width, border_width, width - border_width, height - border_width],
+                                  outline=border, width=3)
+    return img
+
+def create_book_cover(title, author, filename, width=400, height=600, family=None):
+    """Create a book cover image with title and author."""
     
-    # Try to load a font, fall back to default if not available
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
-        author_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-    except:
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 36)
-            author_font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            title_font = ImageFont.load_default()
-            author_font = ImageFont.load_default()
+    # Start from the cached gradient and border
+    img = cover_template(width, height).copy()
+    draw = ImageDraw.Draw(img)
+    
+    # Fonts are resolved and loaded once per process
+    title_font = get_font(36, family)
+    author_font = get_font(24, family)
     
     # Wrap title text
     title_lines = textwrap.wrap(title, width=20)
@@ -47,9 +127,7 @@ def create_book_cover(title, author, filename, width=400, height=600):
     
     # Draw title
     for i, line in enumerate(title_lines):
-        bbox = draw.textbbox((0, 0), line, font=title_font)
-        text_width = bbox[2] - bbox[0]
-        x = (width - text_width) // 2
+        x = (width - text_width(line, 36, family)) // 2
         y = title_y + i * line_height
         
         # Add text shadow for better readability
@@ -59,9 +137,7 @@ def create_book_cover(title, author, filename, width=400, height=600):
     # Draw author
     author_y = height - 150
     for i, line in enumerate(author_lines):
-        bbox = draw.textbbox((0, 0), line, font=author_font)
-        text_width = bbox[2] - bbox[0]
-        x = (width - text_width) // 2
+        x = (width - text_width(line, 24, family)) // 2
         y = author_y + i * 30
         
         # Add text shadow
@@ -70,74 +146,139 @@ def create_book_cover(title, author, filename, width=400, height=600):
     
     return img
 
+def parse_books(source):
+    """Pull title/author/slug/coverUrl for every entry out of app/data/books.ts."""
+    books = []
+    for block in re.findall(r"\n  \{\n([\s\S]*?)\n  \}", source):
+        def field(name):
+            match = re.search(rf'^\s*{name}: "((?:[^"\\]|\\.)*)"', block, re.M)
+            # JSON string escapes cover what the data file uses (\", \\, \u....)
+            return json.loads(f'"{match.group(1)}"') if match else None
+
+        book = {name: field(name) for name in ("title", "author", "slug", "coverUrl")}
+        if book["title"] and book["coverUrl"]:
+            books.append(book)
+    return books
+
+def cover_path(book, output_dir=None):
+    """Where a book's cover lives: its coverUrl under public/, or output_dir."""
+    if output_dir:
+        return os.path.join(output_dir, os.path.basename(book["coverUrl"]))
+    return os.path.join(PUBLIC_DIR, book["coverUrl"].lstrip("/"))
+
+def cover_inputs(book, width=400, height=600):
+    """Everything that determines how a book's cover looks, for the manifest hash."""
+    font_path = resolve_font_path()
+    return {
+        "title": book["title"],
+        "author": book["author"] or "",
+        "palette": COVER_PALETTE,
+        "width": width,
+        "height": height,
+        "font": os.path.basename(font_path) if font_path else "default",
+        "version": GENERATOR_VERSION,
+    }
+
+def render_cover(job):
+    """
+    Worker entry point: render and save one cover.
+    Only the path and timing come back, never the image, so memory stays
+    at one cover per worker however large the catalog is.
+    """
+    title, author, output_path = job
+    start = time.perf_counter()
+    try:
+        cover_img = create_book_cover(title, author, os.path.basename(output_path))
+        
+        # Write to a temporary file first so an interrupted run never leaves a torn image
+        extension = os.path.splitext(output_path)[1].lower()
+        image_format = "JPEG" if extension in (".jpg", ".jpeg") else Image.registered_extensions().get(extension, "PNG")
+        tmp_path = f"{output_path}.tmp"
+        if image_format == "JPEG":
+            cover_img.save(tmp_path, image_format, quality=95)
+        else:
+            cover_img.save(tmp_path, image_format)
+        os.replace(tmp_path, output_path)
+        return output_path, (time.perf_counter() - start) * 1000, None
+    except Exception as e:
+        return output_path, (time.perf_counter() - start) * 1000, str(e)
+
 def main():
-    """Generate all book cover images."""
-    
-    # Book data
-    books = [
-        {
-            "title": "Tomorrow, and Tomorrow, and Tomorrow",
-            "author": "Gabrielle Zevin",
-            "filename": "tomorrow-and-tomorrow.jpg"
-        },
-        {
-            "title": "Amusing Ourselves to Death",
-            "author": "Neil Postman",
-            "filename": "amusing-ourselves-to-death.jpg"
-        },
-        {
-            "title": "Abundance: Progress Takes Imagination",
-            "author": "Ezra Klein",
-            "filename": "abundance-progress.jpg"
-        },
-        {
-            "title": "Animal Farm",
-            "author": "George Orwell",
-            "filename": "animal-farm.jpg"
-        },
-        {
-            "title": "Do Androids Dream Of Electric Sheep?",
-            "author": "Philip K. Dick",
-            "filename": "do-androids-dream.jpg"
-        },
-        {
-            "title": "Artificial Intelligence: A Modern Approach",
-            "author": "Peter Norvig & Stuart Russell",
-            "filename": "ai-modern-approach.jpg"
-        },
-        {
-            "title": "The Business of Venture Capital",
-            "author": "Mahendra Ramsinghani",
-            "filename": "business-venture-capital.jpg"
-        },
-        {
-            "title": "Exhalation: Stories",
-            "author": "Ted Chiang",
-            "filename": "exhalation-stories.jpg"
-        }
-    ]
-    
-    # Create output directory
-    output_dir = "public/images/books"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate each book cover
+    """Generate covers for catalog entries whose cover file is missing."""
+    parser = argparse.ArgumentParser(description="Generate placeholder covers for app/data/books.ts")
+    parser.add_argument("--books", default=BOOKS_FILE, help="catalog to read")
+    parser.add_argument("--out", help="write covers here instead of their coverUrl under public/")
+    parser.add_argument("--all", action="store_true",
+                        help="render every entry, not just missing ones (requires --out)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--dry-run", action="store_true", help="list what would be rendered")
+    args = parser.parse_args()
+    
+    # Never overwrite real cover artwork with placeholders
+    if args.all and not args.out:
+        parser.error("--all would replace downloaded covers; pass --out to render elsewhere")
+    
+    with open(args.books, encoding="utf-8") as f:
+        books = parse_books(f.read())
+    
+    # Entries can share a coverUrl; render each file once
+    covers = {}
     for book in books:
-        print(f"Generating cover for: {book['title']}")
-        
-        # Create the book cover image
-        cover_img = create_book_cover(
-            book["title"], 
-            book["author"], 
-            book["filename"]
-        )
-        
-        # Save the image
-        output_path = os.path.join(output_dir, book["filename"])
-        cover_img.save(output_path, "JPEG", quality=95)
-        print(f"Saved: {output_path}")
+        covers.setdefault(cover_path(book, args.out), book)
+    
+    # Manifest only tracks the real cover locations
+    manifest = None if args.out else CoverManifest("books")
+    digests = {output_path: input_hash(**cover_inputs(book)) for output_path, book in covers.items()}
+    
+    jobs = []
+    changed = 0
+    for output_path, book in covers.items():
+        if args.all or not os.path.exists(output_path):
+            jobs.append((book["title"], book["author"] or "", output_path))
+        elif (manifest and manifest.recorded(output_path)
+              and not manifest.is_current(output_path, digests[output_path])):
+            jobs.append((book["title"], book["author"] or "", output_path))
+            changed += 1
+    
+    print(f"{len(books)} books in catalog, {len(covers) - len(jobs)} covers up to date, "
+          f"{len(jobs) - changed} missing, {changed} with changed inputs")
+    if manifest:
+        for orphan in manifest.orphans(covers):
+            print(f"  Orphaned: {orphan} (generated, but no catalog entry uses it)")
+    if args.dry_run or not jobs:
+        for title, _, output_path in jobs:
+            print(f"  {output_path}  ({title})")
+        if manifest and not args.dry_run:
+            manifest.save()
+        return
+    
+    for directory in {os.path.dirname(output_path) for _, _, output_path in jobs}:
+        os.makedirs(directory, exist_ok=True)
+    
+    start = time.perf_counter()
+    failures = 0
+    render_ms = 0.0
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(jobs))) as pool:
+        futures = [pool.submit(render_cover, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            output_path, elapsed_ms, error = future.result()
+            render_ms += elapsed_ms
+            if error:
+                failures += 1
+                print(f"[{done}/{len(jobs)}] Failed: {output_path}: {error}")
+            else:
+                print(f"[{done}/{len(jobs)}] Saved: {output_path} ({elapsed_ms:.1f} ms)")
+                if manifest:
+                    manifest.record(output_path, digests[output_path])
+    
+    if manifest:
+        manifest.save()
     
-    print("\nAll book covers generated successfully!")
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(jobs) - failures} covers generated, {failures} failed in {elapsed:.2f}s "
+          f"({render_ms / len(jobs):.1f} ms per cover, {args.workers} workers)")
+    if failures:
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
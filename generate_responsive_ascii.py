@@ -1,87 +1,147 @@
 #!/usr/bin/env python3
 """
 Generate responsive ASCII art for LUCAS in multiple sizes
+Every breakpoint is scaled from the one banner master in banner.py
+
+Writes lucas_ascii_{desktop,tablet,mobile,ultra}.txt and the TypeScript module
+the home page renders, so the variants can't drift apart.
 """
 
-def create_mobile_ascii():
-    """Create compact ASCII art for mobile devices"""
-    patterns = [
-        "▒▒    ▒▒  ▒▒  ▒▒▒  ▒▒▒  ▒▒▒",
-        "▒▒    ▒▒  ▒▒  ▒    ▒▒▒  ▒  ",
-        "▒▒    ▒▒  ▒▒  ▒    ▒▒▒  ▒▒▒",
-        "▒▒    ▒▒  ▒▒  ▒    ▒ ▒    ▒",
-        "▒▒▒▒  ▒▒▒▒   ▒▒▒  ▒  ▒  ▒▒▒"
-    ]
-    return "\n".join(patterns)
-
-def create_tablet_ascii():
-    """Create medium-sized ASCII art for tablets"""
-    patterns = [
-        "▒▒▒     ▒▒  ▒▒  ▒▒▒▒   ▒▒▒▒   ▒▒▒▒ ",
-        "▒▒▒     ▒▒  ▒▒  ▒▒     ▒▒▒▒   ▒▒   ",
-        "▒▒▒     ▒▒  ▒▒  ▒▒     ▒▒▒▒   ▒▒▒▒ ",
-        "▒▒▒     ▒▒  ▒▒  ▒▒     ▒  ▒      ▒▒",
-        "▒▒▒▒▒▒  ▒▒▒▒▒   ▒▒▒▒   ▒  ▒   ▒▒▒▒ "
-    ]
-    return "\n".join(patterns)
-
-def create_desktop_ascii():
-    """Create full-sized ASCII art for desktop"""
-    patterns = [
-        "▒▒▒        ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ ",
-        "▒▒▒        ▒▒▒  ▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒    ▒▒▒▒▒▒ ",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     ",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒  ▒▒▒     ",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ ",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒ ",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒",
-        "▒▒▒        ▒▒▒  ▒▒▒  ▒▒▒       ▒▒▒  ▒▒▒       ▒▒▒",
-        "▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ ",
-        "▒▒▒▒▒▒▒▒   ▒▒▒▒▒▒    ▒▒▒▒▒▒   ▒▒▒  ▒▒▒   ▒▒▒▒▒▒ "
-    ]
-    return "\n".join(patterns)
-
-def create_ultra_compact_ascii():
-    """Create ultra-compact ASCII for very small screens"""
-    patterns = [
-        "█  █ █ ███ ███ ███",
-        "█  █ █ █   █ █ █  ",
-        "███ ███ ███ ███ ███"
+import numpy as np
+import json
+
+from banner import GLYPHS, GLYPH_HEIGHT
+
+TEXT = "LUCAS"
+TS_MODULE = "app/data/asciiBanner.ts"
+
+# name -> (maximum columns, rows, fill character). Tablet keeps the hand-drawn
+# variant's 35 columns; mobile gets 29 so its letters stay 5 wide with 2-column
+# strokes - about 209 px at text-xs, inside the ~262 px banner box on a 320 px phone
+BREAKPOINTS = {
+    "desktop": (48, 10, "▒"),
+    "tablet": (35, 5, "▒"),
+    "mobile": (29, 5, "▒"),
+    "ultra": (19, 5, "█"),
+}
+
+# Master letter width and spacing the glyph table is drawn at
+MASTER_WIDTH = 8
+MASTER_SPACING = 2
+
+def sample(size, target):
+    """Nearest source index for each of target cells spread over size cells"""
+    return ((np.arange(target) + 0.5) * size / target).astype(np.intp)
+
+def sample_symmetric(size, target):
+    """
+    sample() with the right half mirrored from the left
+
+    Plain nearest sampling can take more columns from one side than the
+    other (8 -> 4 keeps 1 column of a left stroke and 2 of a right one).
+    """
+    indices = sample(size, target)
+    half = target // 2
+    indices[target - half:] = size - 1 - indices[:half][::-1]
+    return indices
+
+def scaled_layout(text, letter_width):
+    """Per-glyph widths and spacing for letters letter_width columns wide"""
+    scale = letter_width / MASTER_WIDTH
+    widths = [max(1, round(len(GLYPHS[char][0]) * scale)) for char in text]
+    spacing = max(1, round(MASTER_SPACING * scale))
+    return widths, spacing
+
+def fit_banner(text, columns, rows, fill_char):
+    """
+    Scale the master banner to fit a column budget
+
+    Glyphs of the same master width share one column map, mirrored about
+    the glyph's centre, so left and right strokes stay the same width. The
+    largest letter width whose banner fits is used, closing the gaps between
+    letters (down to one column) before shrinking them.
+
+    Args:
+        text: Text to render (characters from banner.GLYPHS)
+        columns: Maximum width in characters
+        rows: Height in characters
+        fill_char: Character for filled cells
+
+    Returns:
+        List of rows
+    """
+    text = text.upper()
+    for letter_width in range(MASTER_WIDTH, 0, -1):
+        widths, spacing = scaled_layout(text, letter_width)
+        spacing = min(spacing, max(1, (columns - sum(widths)) // max(1, len(text) - 1)))
+        if sum(widths) + spacing * (len(text) - 1) <= columns:
+            break
+
+    ys = sample(GLYPH_HEIGHT, rows)
+    glyphs = []
+    for char, width in zip(text, widths):
+        mask = np.array([[cell == "#" for cell in row] for row in GLYPHS[char]])
+        cells = mask[np.ix_(ys, sample_symmetric(mask.shape[1], width))]
+        glyphs.append(["".join(fill_char if cell else " " for cell in row) for row in cells])
+
+    gap = " " * spacing
+    return [gap.join(parts) for parts in zip(*glyphs)]
+
+def generate_all(text=TEXT):
+    """Every breakpoint from one master, as name -> list of rows"""
+    return {
+        name: fit_banner(text, columns, rows, fill_char)
+        for name, (columns, rows, fill_char) in BREAKPOINTS.items()
+    }
+
+def ts_string(value):
+    """JavaScript string literal (JSON strings are valid JS)"""
+    return json.dumps(value, ensure_ascii=False)
+
+def write_ts_module(variants, path=TS_MODULE):
+    """Write the breakpoints as precomputed lines, text and sizes"""
+    lines = [
+        "// Generated by generate_responsive_ascii.py - do not edit by hand.",
+        f"// Every breakpoint is scaled from the same {TEXT} banner master.",
+        "",
+        "export interface AsciiBanner {",
+        "  lines: readonly string[];",
+        "  text: string;",
+        "  width: number;",
+        "  height: number;",
+        "}",
+        "",
+        "export const asciiBanner = {",
     ]
-    return "\n".join(patterns)
+    for name, rows in variants.items():
+        lines.append(f"  {name}: {{")
+        lines.append("    lines: [")
+        lines.extend(f"      {ts_string(row)}," for row in rows)
+        lines.append("    ],")
+        lines.append(f"    text: {ts_string(chr(10).join(rows))},")
+        lines.append(f"    width: {max(len(row) for row in rows)},")
+        lines.append(f"    height: {len(rows)},")
+        lines.append("  },")
+    lines.append("} satisfies Record<string, AsciiBanner>;")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
 
 def main():
     print("Generating responsive ASCII art for LUCAS...")
-    
-    # Save mobile version
-    mobile_art = create_mobile_ascii()
-    with open('lucas_ascii_mobile.txt', 'w') as f:
-        f.write(mobile_art)
-    print("\nMobile version:")
-    print(mobile_art)
-    
-    # Save tablet version
-    tablet_art = create_tablet_ascii()
-    with open('lucas_ascii_tablet.txt', 'w') as f:
-        f.write(tablet_art)
-    print("\nTablet version:")
-    print(tablet_art)
-    
-    # Save desktop version
-    desktop_art = create_desktop_ascii()
-    with open('lucas_ascii_desktop.txt', 'w') as f:
-        f.write(desktop_art)
-    print("\nDesktop version:")
-    print(desktop_art)
-    
-    # Save ultra-compact version
-    ultra_art = create_ultra_compact_ascii()
-    with open('lucas_ascii_ultra.txt', 'w') as f:
-        f.write(ultra_art)
-    print("\nUltra-compact version:")
-    print(ultra_art)
-    
+
+    variants = generate_all()
+    for name, rows in variants.items():
+        art = "\n".join(rows)
+        with open(f'lucas_ascii_{name}.txt', 'w') as f:
+            f.write(art)
+        print(f"\n{name.capitalize()} version ({max(len(row) for row in rows)} columns):")
+        print(art)
+
+    write_ts_module(variants)
+    print(f"\nWrote {TS_MODULE}")
+
     print("\nAll versions saved successfully!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
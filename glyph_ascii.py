@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Structural ASCII Art Converter
+Picks the glyph whose shape best matches each cell instead of mapping mean brightness
+
+Every candidate glyph is rasterized once into a small bitmap atlas. Each
+image cell is then scored against the whole atlas with two matrix
+products: mean brightness error, plus how badly the glyph's zero-mean shape,
+scaled to the cell's contrast, fits the cell's. Edges come out as
+/ \\ | _ - rather than as a stair-step of density characters.
+"""
+
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import sys
+import os
+
+from ascii_render import render_codepoints
+
+FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "public", "fonts", "JetBrainsMono-latin.woff2")
+
+# Line-art glyphs plus the block shades used in realistic_lucas_ascii.py
+GLYPHS = " .,'`-_:;=+*/\\|()<>^v#%@█▓▒░▀▄▌▐"
+
+# Unicode block elements have exact geometry, and the vendored Latin-subset
+# font has no outlines for them, so they are drawn rather than rasterized:
+# (ink coverage, (left, top, right, bottom) as fractions of the cell)
+BLOCK_GLYPHS = {
+    "█": (1.0, (0, 0, 1, 1)),
+    "▓": (0.75, (0, 0, 1, 1)),
+    "▒": (0.5, (0, 0, 1, 1)),
+    "░": (0.25, (0, 0, 1, 1)),
+    "▀": (1.0, (0, 0, 1, 0.5)),
+    "▄": (1.0, (0, 0.5, 1, 1)),
+    "▌": (1.0, (0, 0, 0.5, 1)),
+    "▐": (1.0, (0.5, 0, 1, 1)),
+}
+
+# How much mean brightness counts against shape when scoring a glyph. Font
+# strokes are thinner than most drawn lines, so full weight would push thick
+# lines back to half blocks.
+BRIGHTNESS_WEIGHT = 0.5
+
+# Faintest a line glyph's strokes can be scaled when matched, relative to
+# how the font draws them
+MIN_CONTRAST = 0.3
+
+def _load_font(font_path, size):
+    try:
+        return ImageFont.truetype(font_path, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+@lru_cache(maxsize=16)
+def glyph_atlas(glyphs=GLYPHS, cell=(4, 8), font_path=FONT_PATH):
+    """
+    Rasterize every glyph once into an ink-coverage atlas
+
+    Glyphs are drawn at 64px in a monospace advance x line-height box and
+    box-filtered down to the cell size, so the atlas holds antialiased
+    coverage in [0, 1] (1 = full ink).
+
+    Args:
+        glyphs: Candidate characters
+        cell: (width, height) of one character cell in source pixels
+        font_path: TTF/OTF/WOFF2 font used for non-block glyphs
+
+    Returns:
+        (uint32 code points of shape (n,), float32 atlas of shape (n, width * height))
+    """
+    cell_width, cell_height = cell
+    font = _load_font(font_path, 64)
+    ascent, descent = font.getmetrics()
+    box = (max(1, round(font.getlength("M"))), ascent + descent)
+
+    tiles = []
+    for glyph in glyphs:
+        if glyph in BLOCK_GLYPHS:
+            coverage, (left, top, right, bottom) = BLOCK_GLYPHS[glyph]
+            tile = np.zeros((cell_height, cell_width), dtype=np.float32)
+            tile[round(top * cell_height):round(bottom * cell_height),
+                 round(left * cell_width):round(right * cell_width)] = coverage
+        else:
+            img = Image.new('L', box, 0)
+            ImageDraw.Draw(img).text((0, 0), glyph, font=font, fill=255)
+            img = img.resize(cell, Image.Resampling.BOX)
+            tile = np.asarray(img, dtype=np.float32) / 255
+        tiles.append(tile.ravel())
+
+    codepoints = np.array([ord(glyph) for glyph in glyphs], dtype=np.uint32)
+    return codepoints, np.stack(tiles)
+
+@lru_cache(maxsize=16)
+def glyph_scoring(glyphs=GLYPHS, cell=(4, 8), font_path=FONT_PATH):
+    """
+    Per-glyph terms of the match score, derived once from the glyph atlas
+
+    Matching on raw L2 distance lets the flat shades win on brightness alone,
+    so line glyphs never get picked. Instead each glyph is split into mean
+    brightness and a unit-length zero-mean shape, and the shape is compared
+    by correlation, scaled to the cell's contrast (see match_cells). Flat
+    glyphs have an all-zero shape and compete on brightness only.
+
+    Returns:
+        (uint32 code points (n,), float32 unit shapes (width * height, n),
+         float32 brightness weights (width * height, n), float32 brightness bias (n,),
+         float32 least shape scale (n,))
+    """
+    codepoints, atlas = glyph_atlas(glyphs, cell, font_path)
+    area = atlas.shape[1]
+    means = atlas.mean(axis=1)
+    shapes = atlas - means[:, None]
+    contrast = np.sqrt((shapes * shapes).sum(axis=1))
+    shapes /= np.where(contrast > 1e-6, contrast, np.inf)[:, None]
+
+    # weight * area * (cell mean - glyph mean)^2 without the cell mean^2 term,
+    # which is the same for every glyph: a product with the cell plus a bias
+    weight = BRIGHTNESS_WEIGHT * area
+    brightness = np.tile(-2 * weight / area * means, (area, 1))
+    bias = weight * means * means
+    return (codepoints, np.ascontiguousarray(shapes.T), brightness.astype(np.float32),
+            bias, MIN_CONTRAST * contrast)
+
+def match_cells(ink, cell, glyphs=GLYPHS, font_path=FONT_PATH):
+    """
+    Best-matching glyph for every cell of an ink-coverage image
+
+    Args:
+        ink: 2D float array in [0, 1], shape (rows * cell height, cols * cell width)
+        cell: (width, height) of one character cell in pixels
+
+    Returns:
+        2D uint32 array of code points (rows x cols)
+    """
+    cell_width, cell_height = cell
+    rows = ink.shape[0] // cell_height
+    cols = ink.shape[1] // cell_width
+    codepoints, shapes, brightness, bias, least_scale = glyph_scoring(glyphs, cell, font_path)
+
+    # (rows, ch, cols, cw) -> (rows * cols, ch * cw) cell vectors
+    cells = (ink[:rows * cell_height, :cols * cell_width]
+             .reshape(rows, cell_height, cols, cell_width)
+             .transpose(0, 2, 1, 3)
+             .reshape(rows * cols, cell_height * cell_width))
+
+    scores = cells @ brightness
+    scores += bias
+
+    # Plus the shape residual |c - q u|^2 of the glyph's unit shape u scaled
+    # by the best q, but no fainter than MIN_CONTRAST of its drawn strokes: a
+    # line glyph always shows them, so on a flat cell, or one whose shape
+    # runs against it, it costs more than a flat shade. Expanded, that is
+    # |c|^2 + q (q - 2 p) with p = c.u; |c|^2 is the same for every glyph and
+    # the cell mean drops out of p because every shape row sums to zero.
+    # Flat glyphs have p = q = 0.
+    projection = cells @ shapes
+    scale = np.maximum(projection, least_scale)
+    projection *= -2
+    projection += scale
+    scale *= projection
+    scores += scale
+    return codepoints[scores.argmin(axis=1)].reshape(rows, cols)
+
+def image_to_glyph_ascii(image_path, width=120, height_ratio=0.5, glyphs=GLYPHS,
+                         cell=(4, 8), font_path=FONT_PATH):
+    """
+    Convert an image to ASCII art by matching glyph shapes
+
+    Args:
+        image_path: Path to the input image
+        width: Target width in characters
+        height_ratio: Aspect ratio adjustment (since terminal chars are taller than wide)
+        glyphs: Candidate characters
+        cell: (width, height) in pixels each character is matched over
+        font_path: Font used to rasterize the glyph atlas
+
+    Returns:
+        ASCII art as string
+    """
+
+    try:
+        img = Image.open(image_path).convert('L')
+
+        original_width, original_height = img.size
+        aspect_ratio = original_height / original_width
+        new_height = int(aspect_ratio * width * height_ratio)
+
+        # One area-averaging resize straight to cell resolution, the same
+        # filter the glyph atlas is built with
+        cell_width, cell_height = cell
+        img = img.resize((width * cell_width, new_height * cell_height), Image.Resampling.BOX)
+
+        # Dark pixels are ink, matching the density ramp in ascii_converter
+        ink = np.asarray(img, dtype=np.float32)
+        ink *= -1 / 255
+        ink += 1
+        return render_codepoints(match_cells(ink, cell, glyphs, font_path))
+
+    except Exception as e:
+        return f"Error processing image: {str(e)}"
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python glyph_ascii.py <image_path> [width]")
+        sys.exit(1)
+
+    image_path = sys.argv[1]
+    width = int(sys.argv[2]) if len(sys.argv) == 3 else 120
+
+    if not os.path.exists(image_path):
+        print(f"Error: Image file '{image_path}' not found")
+        sys.exit(1)
+
+    print(image_to_glyph_ascii(image_path, width=width))
+
+if __name__ == "__main__":
+    main()
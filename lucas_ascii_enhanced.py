@@ -3,6 +3,8 @@
 Enhanced LUCAS ASCII art with uniform width and letter patterns
 """
 
+from banner import render
+
 def create_lucas_ascii():
     """
     Create LUCAS ASCII art where each letter is made from its own character
@@ -32,131 +34,16 @@ def create_lucas_ascii_blocks():
     """
     Create a block-style version using Unicode block characters
     """
-    # Using Unicode blocks for more visual impact
-    block = "█"
-    
-    patterns = []
-    
-    # L pattern
-    L = [
-        f"{block*3}      ",
-        f"{block*3}      ",
-        f"{block*3}      ",
-        f"{block*3}      ",
-        f"{block*8}"
-    ]
-    
-    # U pattern  
-    U = [
-        f"{block*3}  {block*3}",
-        f"{block*3}  {block*3}",
-        f"{block*3}  {block*3}",
-        f"{block*3}  {block*3}",
-        f" {block*6} "
-    ]
-    
-    # C pattern
-    C = [
-        f" {block*6} ",
-        f"{block*3}     ",
-        f"{block*3}     ",
-        f"{block*3}     ",
-        f" {block*6} "
-    ]
-    
-    # A pattern
-    A = [
-        f" {block*6} ",
-        f"{block*3}  {block*3}",
-        f"{block*8}",
-        f"{block*3}  {block*3}",
-        f"{block*3}  {block*3}"
-    ]
-    
-    # S pattern
-    S = [
-        f" {block*6} ",
-        f"{block*3}     ",
-        f" {block*6} ",
-        f"     {block*3}",
-        f" {block*6} "
-    ]
-    
-    # Combine letters with spacing, doubled height
-    for row in range(5):
-        line = ""
-        line += L[row] + "  "
-        line += U[row] + "  "
-        line += C[row] + "  "
-        line += A[row] + "  "
-        line += S[row]
-        # Double each line for height
-        patterns.append(line)
-        patterns.append(line)
-    
-    return "\n".join(patterns)
+    # Using Unicode blocks for more visual impact, doubled height
+    return render("LUCAS", "█", y_scale=2)
 
 def create_mixed_style():
     """
     Create a version that uses the letter itself in the pattern
     Each letter is 8 chars wide for uniformity
     """
-    patterns = []
-    
-    # Define each letter pattern using the letter itself
-    L = [
-        "LLL     ",
-        "LLL     ",
-        "LLL     ",
-        "LLL     ",
-        "LLLLLLLL"
-    ]
-    
-    U = [
-        "UUU  UUU",
-        "UUU  UUU",
-        "UUU  UUU",
-        "UUU  UUU",
-        " UUUUUU "
-    ]
-    
-    C = [
-        " CCCCCC ",
-        "CCC     ",
-        "CCC     ",
-        "CCC     ",
-        " CCCCCC "
-    ]
-    
-    A = [
-        " AAAAAA ",
-        "AAA  AAA",
-        "AAAAAAAA",
-        "AAA  AAA",
-        "AAA  AAA"
-    ]
-    
-    S = [
-        " SSSSSS ",
-        "SSS     ",
-        " SSSSSS ",
-        "     SSS",
-        " SSSSSS "
-    ]
-    
-    # Combine with double height
-    for row in range(5):
-        line = ""
-        line += L[row] + "  "
-        line += U[row] + "  "
-        line += C[row] + "  "
-        line += A[row] + "  "
-        line += S[row]
-        # Double each line
-        patterns.append(line)
-        patterns.append(line)
-    
-    return "\n".join(patterns)
+    # Each letter drawn with itself, doubled height
+    return render("LUCAS", None, y_scale=2)
 
 def main():
     print("LUCAS ASCII Art - Enhanced Version")
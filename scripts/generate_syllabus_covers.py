@@ -9,19 +9,29 @@ color-coded by syllabus part, written to /public/images/syllabus/<slug>.svg.
 Every reading that is an actual book gets real publisher artwork instead, via
 scripts/fetch_syllabus_covers.py.
 
+Covers are only rewritten when their inputs change: cover_manifest.json
+records a hash of each cover's title, author, palette, size and generator
+version. SVGs no reading produces any more are reported as orphans.
+
 Usage:
     python3 scripts/generate_syllabus_covers.py
+    python3 scripts/generate_syllabus_covers.py --force   # rewrite everything
 """
 
+import argparse
 import os
+import sys
 from xml.sax.saxutils import escape
 
-OUT_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-    "public",
-    "images",
-    "syllabus",
-)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cover_manifest import CoverManifest, input_hash  # noqa: E402
+
+OUT_DIR = os.path.join(ROOT, "public", "images", "syllabus")
+
+# Bump whenever build_svg changes what a cover looks like
+GENERATOR_VERSION = 1
 
 WIDTH, HEIGHT = 400, 600
 
@@ -127,14 +137,57 @@ def build_svg(slug, part_id, title, author, kind):
 """
 
 
+def cover_inputs(slug, part_id, title, author, kind):
+    """Everything that determines a cover's SVG, for the manifest hash."""
+    return {
+        "slug": slug,
+        "title": title,
+        "author": author,
+        "kind": kind,
+        "palette": PARTS[part_id],
+        "size": (WIDTH, HEIGHT),
+        "version": GENERATOR_VERSION,
+    }
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate syllabus cover SVGs")
+    parser.add_argument("--force", action="store_true", help="rewrite every cover")
+    args = parser.parse_args()
+
     os.makedirs(OUT_DIR, exist_ok=True)
+    manifest = CoverManifest("syllabus")
+    paths = []
+    written = 0
     for slug, part_id, title, author, kind in READINGS:
         path = os.path.join(OUT_DIR, f"{slug}.svg")
+        paths.append(path)
+        digest = input_hash(**cover_inputs(slug, part_id, title, author, kind))
+        if not args.force and manifest.is_current(path, digest):
+            continue
+        svg = build_svg(slug, part_id, title, author, kind)
+        manifest.record(path, digest)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                if handle.read() == svg:
+                    continue
         with open(path, "w", encoding="utf-8") as handle:
-            handle.write(build_svg(slug, part_id, title, author, kind))
+            handle.write(svg)
+        written += 1
         print(f"wrote {path}")
-    print(f"\n{len(READINGS)} covers generated")
+
+    # SVGs in the output directory that no reading produces any more
+    produced = {os.path.basename(path) for path in paths}
+    strays = sorted(name for name in os.listdir(OUT_DIR)
+                    if name.endswith(".svg") and name not in produced)
+    orphans = set(manifest.orphans(paths)) | {
+        os.path.relpath(os.path.join(OUT_DIR, name), ROOT) for name in strays
+    }
+    for orphan in sorted(orphans):
+        print(f"orphaned: {orphan}")
+
+    manifest.save()
+    print(f"\n{written} covers generated, {len(READINGS) - written} unchanged")
 
 
 if __name__ == "__main__":
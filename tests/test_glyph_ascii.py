@@ -0,0 +1,54 @@
+"""Shape matching in glyph_ascii picks line glyphs for line art"""
+
+from PIL import Image, ImageDraw
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from glyph_ascii import image_to_glyph_ascii
+
+SHADES = set("░▒▓█")
+
+def render(tmp_path, size, columns, *lines, fill=255, stroke=3):
+    img = Image.new('L', size, fill)
+    draw = ImageDraw.Draw(img)
+    for line in lines:
+        draw.line(line, fill=0, width=stroke)
+    path = tmp_path / "line_art.png"
+    img.save(path)
+    return image_to_glyph_ascii(str(path), width=columns).rstrip("\n").split("\n")
+
+# 160x320 at 20 columns resamples to exact 4x8 cells, 2 source pixels per
+# cell pixel, so a corner-to-corner diagonal crosses one cell per row
+CELLS = (160, 320)
+
+def test_diagonals_pick_slashes(tmp_path):
+    rows = render(tmp_path, CELLS, 20, (0, 0, 160, 320), (0, 320, 160, 0))
+    art = "".join(rows)
+    assert art.count("\\") >= 18
+    assert art.count("/") >= 18
+    assert not SHADES & set(art)
+
+def test_vertical_line_picks_bar(tmp_path):
+    x = 2 * (10 * 4 + 1.5)  # centre of column 10
+    rows = render(tmp_path, CELLS, 20, (x, 0, x, 320))
+    assert {row[10] for row in rows} == {"|"}
+
+def test_baseline_picks_underscore(tmp_path):
+    y = 2 * (10 * 8 + 6)  # underscore height in row 10
+    rows = render(tmp_path, CELLS, 20, (0, y, 160, y))
+    assert set(rows[10]) == {"_"}
+
+def test_unaligned_line_art_avoids_flat_shades(tmp_path):
+    # Thin strokes that don't line up with the cells: brightness-only
+    # distance answered these with ░
+    rows = render(tmp_path, (240, 240), 30, (0, 0, 239, 239), (0, 239, 239, 0), stroke=2)
+    assert not SHADES & set("".join(rows))
+
+    rows = render(tmp_path, (240, 240), 30, (123, 0, 123, 239), stroke=2)
+    assert {row[15] for row in rows} == {"|"}
+
+def test_flat_regions_match_brightness(tmp_path):
+    rows = render(tmp_path, CELLS, 20, fill=128)
+    assert set("".join(rows)) == {"▒"}